@@ -4,11 +4,29 @@ This module provides abstractions for handling conversational I/O between
 the AI agent and users across different interfaces (CLI, web, etc.).
 """
 
+from functools import lru_cache
 from typing import Protocol
 
 from rich.console import Console
 from rich.markdown import Markdown
 
+# Inputs that end the chat session (compared casefolded)
+_EXIT_WORDS: frozenset[str] = frozenset({"exit", "quit", "bye"})
+_GOODBYE = "\n[blue]GOODBYE[/blue]"
+
+# Characters that suggest markdown; messages without any are printed as plain text
+_MD_CHARS: frozenset[str] = frozenset("#*`[]_-|>")
+
+
+@lru_cache
+def _get_console() -> Console:
+    """Get the shared console (terminal capabilities are probed once).
+
+    Emoji shortcode scanning and the repr highlighter are disabled: both run a
+    regex pass over every printed string and neither is used by the chat output.
+    """
+    return Console(highlight=False, emoji=False)
+
 
 class ChatHandler(Protocol):
     """Protocol for general I/O operations.
@@ -49,24 +67,25 @@ class CliChatHandler:
     """Chat Handler for CLI usage."""
 
     def __init__(self) -> None:
-        self.console = Console()
+        self.console = _get_console()
 
     def display_agent_message(self, message: str) -> None:
         """Displays the message coming from the AI agent."""
         self.console.print("[cyan]TaskWeaver:[/cyan]", end=" ")
-        self.console.print(Markdown(message))
+        # Skip the markdown parser for plain replies ("Task marked completed.")
+        self.console.print(message if _MD_CHARS.isdisjoint(message) else Markdown(message))
         self.console.print()  # Blank line
 
     def get_user_input(self, prompt: str = "") -> str | None:
         """Agent can use this to get the user input."""
         try:
             user_input = self.console.input(f"[bold green]{prompt}[/bold green]")
-            if user_input.lower() in ("exit", "quit", "bye"):
-                self.console.print("\n[blue]GOODBYE[/blue]")
+            if user_input.strip().casefold() in _EXIT_WORDS:
+                self.console.print(_GOODBYE)
                 return None
             return user_input
         except (EOFError, KeyboardInterrupt):
-            self.console.print("\n[blue]GOODBYE[/blue]")
+            self.console.print(_GOODBYE)
             return None
 
     def display_system_message(self, message: str) -> None:
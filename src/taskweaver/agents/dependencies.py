@@ -6,7 +6,7 @@ from ..database.dependency_repository import TaskDependencyRepository
 from ..database.repository import TaskRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDependencies:
     """Container for task-related repositories and memory.
 
@@ -1,22 +1,132 @@
 """Github issues functions."""
 
-from operator import attrgetter
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 
-from github import Github
-from github.Issue import Issue
+import orjson
+from github import Auth, Github
 from loguru import logger
 
+# Upper bound on concurrent REST fetches (one worker per repository)
+MAX_FETCH_WORKERS = 8
 
-def get_github_issues(repo_names: list[str]) -> list[dict]:
+# Issues per page - maximum allowed by both REST and GraphQL (REST default is 30)
+ISSUES_PER_PAGE = 100
+
+# Seconds a fetched issue list is reused before hitting GitHub again
+ISSUES_CACHE_TTL_S = 60.0
+
+# Upper bound on the serialized issues returned in one prompt or tool call
+MAX_ISSUES_PAYLOAD_CHARS = 50_000
+
+# Fetched issues keyed by sorted repo names -> (monotonic fetch time, issues)
+_ISSUES_CACHE: dict[tuple[str, ...], tuple[float, list[dict]]] = {}
+
+# Open issues selection for one aliased repository
+_ISSUES_SELECTION = """
+    issues(first: {per_page}, states: OPEN, after: $after{i}) {{
+      nodes {{ title body }}
+      pageInfo {{ endCursor hasNextPage }}
+    }}"""
+
+
+def _build_issues_query(count: int) -> str:
+    """Build one GraphQL query fetching a page of open issues for `count` repositories.
+
+    Each repository is aliased as r0, r1, ... and parameterized by its own
+    owner/name/cursor variables so all repos are fetched in a single request.
+
+    Args:
+        count: Number of repositories in the query.
+
+    Returns:
+        GraphQL query string.
+    """
+    params = ", ".join(f"$owner{i}: String!, $name{i}: String!, $after{i}: String" for i in range(count))
+    repos = "\n".join(
+        f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{"
+        f"{_ISSUES_SELECTION.format(i=i, per_page=ISSUES_PER_PAGE)}\n  }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{repos}\n}}"
+
+
+def _get_github_issues_graphql(repo_names: Sequence[str], token: str) -> list[dict]:
+    """Fetch open issues for all repositories through the GraphQL API.
+
+    Pages through every repository concurrently: each request carries one
+    aliased selection per repository that still has a next page.
+
+    Args:
+        repo_names: List of repository identifiers in format "owner/repo".
+        token: GitHub token (GraphQL does not allow anonymous access).
+
+    Returns:
+        List of dictionaries with keys "title" and "body" for each issue.
+    """
+    requester = Github(auth=Auth.Token(token)).requester
+    result: list[dict] = []
+    pending: dict[str, str | None] = dict.fromkeys(repo_names)
+
+    while pending:
+        repos = list(pending)
+        variables: dict[str, str | None] = {}
+        for i, repo in enumerate(repos):
+            owner, name = repo.split("/", 1)
+            variables |= {f"owner{i}": owner, f"name{i}": name, f"after{i}": pending[repo]}
+
+        _, response = requester.graphql_query(_build_issues_query(len(repos)), variables)
+
+        pending = {}
+        for i, repo in enumerate(repos):
+            # Missing or inaccessible repositories come back as a null alias (with an entry in "errors")
+            if (repository := response["data"][f"r{i}"]) is None:
+                logger.warning(f"GitHub repository not found or not accessible, skipped: {repo}")
+                continue
+            issues = repository["issues"]
+            result.extend(issues["nodes"])
+            if issues["pageInfo"]["hasNextPage"]:
+                pending[repo] = issues["pageInfo"]["endCursor"]
+
+    return result
+
+
+def _get_repo_issues_rest(repo_name: str) -> list[dict]:
+    """Fetch open issues for one repository through the REST API.
+
+    Builds its own client so concurrent calls never share requester state.
+
+    Args:
+        repo_name: Repository identifier in format "owner/repo".
+
+    Returns:
+        List of dictionaries with keys "title" and "body" for each issue.
+    """
+    repo = Github(per_page=ISSUES_PER_PAGE).get_repo(repo_name)
+    if not repo.open_issues_count:
+        return []
+    # Single pass over the paginator: no intermediate list of Issue objects. The REST
+    # endpoint also lists pull requests, which GraphQL's issues connection leaves out
+    return [{"title": issue.title, "body": issue.body} for issue in repo.get_issues() if issue.pull_request is None]
+
+
+def get_github_issues(repo_names: Sequence[str]) -> list[dict]:
     """Fetch open GitHub issues from specified repositories.
 
-    Retrieves all open issues from the provided GitHub repositories using
-    unauthenticated access (rate-limited). Extracts issue title and body
-    for use in task creation and prioritization.
+    Retrieves all open issues from the provided GitHub repositories. When a
+    GITHUB_TOKEN is set, all repositories are fetched through batched GraphQL
+    queries (one request per 100 issues); otherwise falls back to unauthenticated
+    REST access (rate-limited), fetching repositories concurrently. Extracts issue
+    title and body for use in task creation and prioritization.
+
+    Results are cached per set of repositories for ISSUES_CACHE_TTL_S seconds,
+    so repeated /github commands within a session don't re-fetch.
 
     Args:
-        repo_names: List of repository identifiers in format "owner/repo"
-            (e.g., ["TheRockPusher/taskweaver", "torvalds/linux"]).
+        repo_names: Repository identifiers in format "owner/repo"
+            (e.g., ("TheRockPusher/taskweaver", "torvalds/linux")).
 
     Returns:
         List of dictionaries with keys "title" and "body" for each issue.
@@ -31,11 +141,61 @@ def get_github_issues(repo_names: list[str]) -> list[dict]:
         >>> print(issues[0]["title"])
         "Fix memory leak in WebSocket handler"
     """
-    g = Github()
     logger.debug(f"Starting - github issues loading for repo {repo_names}")
-    issues: list[Issue] = [issue for repo in repo_names for issue in g.get_repo(repo).get_issues()]
-    logger.debug(f"{len(issues)} issues found")
-    fields: list[str] = ["title", "body"]
-    select_fields = attrgetter(*fields)
-    result = [dict(zip(fields, select_fields(issue), strict=True)) for issue in issues]
-    return result
+    if not repo_names:
+        return []
+
+    cache_key = tuple(sorted(repo_names))
+    now = monotonic()
+    if (cached := _ISSUES_CACHE.get(cache_key)) and now - cached[0] <= ISSUES_CACHE_TTL_S:
+        logger.debug(f"{len(cached[1])} issues served from cache")
+        return list(cached[1])
+
+    if token := os.getenv("GITHUB_TOKEN"):
+        result = _get_github_issues_graphql(repo_names, token)
+    else:
+        # Repositories are independent network-bound fetches: run them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(repo_names))) as executor:
+            per_repo = list(executor.map(_get_repo_issues_rest, repo_names))
+        result = [issue for issues in per_repo for issue in issues]
+
+    logger.debug(f"{len(result)} issues found")
+    _ISSUES_CACHE[cache_key] = (now, result)
+    return list(result)
+
+
+def issues_payload(issues: list[dict], offset: int = 0) -> str:
+    """Serialize one page of GitHub issues, bounded by MAX_ISSUES_PAYLOAD_CHARS.
+
+    Large repositories can return megabytes of issues, far beyond what fits in one
+    prompt. Issues past the budget are not dropped: a note with their count tells
+    the model to page through them with list_github_issues_tool.
+
+    Args:
+        issues: Issues as returned by get_github_issues.
+        offset: Index of the first issue to serialize.
+
+    Returns:
+        Compact JSON string of the issues that fit, followed by the note if any remain.
+    """
+    page = issues[offset:]
+    payload = orjson.dumps(page, default=str).decode()  # default=str handles any non-native type
+    if len(payload) <= MAX_ISSUES_PAYLOAD_CHARS:
+        return payload
+
+    kept = 0
+    size = 2  # Enclosing brackets
+    for issue in page:
+        size += len(orjson.dumps(issue, default=str)) + 1  # Item plus separator
+        if size > MAX_ISSUES_PAYLOAD_CHARS and kept:  # At least one issue, so paging always advances
+            break
+        kept += 1
+    remaining = len(page) - kept
+    next_offset = offset + kept
+    logger.warning(
+        f"GitHub issues payload capped: issues {offset}-{next_offset - 1} of {len(issues)} sent, {remaining} left"
+    )
+    return (
+        f"{orjson.dumps(page[:kept], default=str).decode()}\n"
+        f"({remaining} more issues omitted; call list_github_issues_tool with offset={next_offset} to read them)"
+    )
@@ -1,11 +1,19 @@
 """PydanticAI agent for task orchestration."""
 
-import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import httpx
+import orjson
+from github import GithubException
 from loguru import logger
+from mem0 import Memory
 from pydantic_ai import Agent, AgentRunResult, FunctionToolset, ModelMessage, RunContext
 from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool
+from pydantic_ai.exceptions import AgentRunError, UserError
+from pydantic_ai.models import infer_model
 
 from taskweaver.config import Config
 
@@ -15,13 +23,14 @@ from ..database.dependency_repository import TaskDependencyRepository
 from ..database.repository import TaskRepository
 from .chat_handler import ChatHandler
 from .dependencies import TaskDependencies
-from .github_issues import get_github_issues
+from .github_issues import get_github_issues, issues_payload
 from .tools import (
     add_dependency_tool,
     create_task_tool,
     get_blocked_tool,
     get_blockers_tool,
     get_task_details_tool,
+    list_github_issues_tool,
     list_open_tasks_full,
     list_tasks_tool,
     mark_task_cancelled_tool,
@@ -34,10 +43,24 @@ from .tools import (
 # Prompts directory
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+# Prompt contents keyed by path -> (mtime_ns, text)
+_PROMPT_CACHE: dict[Path, tuple[int, str]] = {}
+
+# Seconds a turn waits for background mem0 initialization before going without memory
+MEMORY_INIT_TIMEOUT_S = 5.0
+
+# Inputs up to this many characters are treated as short replies and skip mem0
+SHORT_INPUT_MAX_LENGTH = 8
+
+# Per-turn failures that leave the session usable: model/API errors, network errors, GitHub errors
+_RECOVERABLE_ERRORS = (AgentRunError, httpx.HTTPError, GithubException)
+
 
 def load_prompt(name: str) -> str:
     """Load prompt from markdown file.
 
+    Contents are cached per path and only re-read when the file's mtime changes.
+
     Args:
         name: Prompt filename without .md extension.
 
@@ -48,13 +71,19 @@ def load_prompt(name: str) -> str:
         FileNotFoundError: If prompt file doesn't exist.
 
     """
-    prompt_path = PROMPTS_DIR / f"{name}.md"
-    return prompt_path.read_text(encoding="utf-8")
+    path = PROMPTS_DIR / f"{name}.md"
+    mtime_ns = path.stat().st_mtime_ns
+    if (cached := _PROMPT_CACHE.get(path)) and cached[0] == mtime_ns:
+        return cached[1]
+    text = path.read_text(encoding="utf-8")
+    _PROMPT_CACHE[path] = (mtime_ns, text)
+    return text
 
 
 # Prepare model name with provider prefix
+@lru_cache(maxsize=1)
 def _get_model_name() -> str:
-    """Get model name with provider prefix for agent initialization.
+    """Get model name with provider prefix for agent initialization (computed once).
 
     Returns:
         Model name with provider prefix (e.g., 'openai:gpt-4o-mini').
@@ -67,77 +96,175 @@ def _get_model_name() -> str:
     return model_name
 
 
-# Toolset 1: Task Management CRUD
-_task_toolset = FunctionToolset(
-    tools=[
-        create_task_tool,
-        list_tasks_tool,
-        get_task_details_tool,
-        mark_task_completed_tool,
-        mark_task_in_progress_tool,
-        mark_task_cancelled_tool,
-        update_task_tool,
-    ],
-    max_retries=3,
-)
+def add_memories(ctx: RunContext[TaskDependencies]) -> str:
+    """Load memory into sys prompt."""
+    return f"\n## MEMORIES\n{ctx.deps.memories}"
 
-# Toolset 2: Dependency Management DAG
-_dependency_toolset = FunctionToolset(
-    tools=[
-        list_open_tasks_full,
-        add_dependency_tool,
-        remove_dependency_tool,
-        get_blockers_tool,
-        get_blocked_tool,
-    ],
-    max_retries=3,
-)
 
-# Module-level agent instance (PydanticAI recommended pattern)
-# Instantiated once and reused throughout the application, similar to FastAPI.
-# defer_model_check=True prevents API key validation at import time (enables testing)
-orchestrator_agent: Agent[TaskDependencies, str] = Agent[TaskDependencies, str](
-    _get_model_name(),
-    deps_type=TaskDependencies,
-    system_prompt=load_prompt("orchestrator_prompt"),
-    tools=[duckduckgo_search_tool()],
-    toolsets=[_task_toolset, _dependency_toolset],
-    defer_model_check=True,
-)
+@lru_cache(maxsize=1)
+def build_orchestrator_agent() -> Agent[TaskDependencies, str]:
+    """Build the orchestrator agent on first use and reuse it afterwards.
 
+    Construction (toolsets, search tool, system prompt) is deferred until a chat
+    starts, so importing this module stays cheap for CLI commands that never chat.
+    defer_model_check=True prevents API key validation at build time (enables testing).
 
-@orchestrator_agent.system_prompt
-def add_memories(ctx: RunContext[TaskDependencies]) -> str:
-    """Load memory into sys prompt."""
-    return f"\n## MEMORIES\n{ctx.deps.memories}"
+    Returns:
+        Shared orchestrator agent instance.
 
+    """
+    # Toolset 1: Task Management CRUD
+    task_toolset = FunctionToolset(
+        tools=[
+            create_task_tool,
+            list_tasks_tool,
+            get_task_details_tool,
+            mark_task_completed_tool,
+            mark_task_in_progress_tool,
+            mark_task_cancelled_tool,
+            update_task_tool,
+        ],
+        max_retries=3,
+    )
 
-def run_chat(handler: ChatHandler, db_path: Path) -> None:
-    """Run interactive chat loop with the orchestrator agent.
+    # Toolset 2: Dependency Management DAG
+    dependency_toolset = FunctionToolset(
+        tools=[
+            list_open_tasks_full,
+            add_dependency_tool,
+            remove_dependency_tool,
+            get_blockers_tool,
+            get_blocked_tool,
+        ],
+        max_retries=3,
+    )
+
+    agent = Agent[TaskDependencies, str](
+        _get_model_name(),
+        deps_type=TaskDependencies,
+        system_prompt=load_prompt("orchestrator_prompt"),
+        tools=[duckduckgo_search_tool(), list_github_issues_tool],
+        toolsets=[task_toolset, dependency_toolset],
+        defer_model_check=True,
+    )
+    agent.system_prompt(add_memories)
+    return agent
+
+
+def _warm_model(model_name: str) -> None:
+    """Load the model's provider ahead of the first turn.
+
+    The agent is built with defer_model_check=True, so its provider (SDK imports,
+    client setup) is otherwise loaded inside the first run_sync call. A throwaway
+    model is resolved here: the shared agent is never touched from this thread.
 
     Args:
-        handler: ChatHandler implementation for I/O operations.
-        db_path: Path to the task database for agent operations.
+        model_name: Model name with provider prefix.
 
     """
-    logger.info(f"Starting chat session with database: {db_path}")
-    handler.display_system_message(f"Current database path: {db_path}")
-    message_history: list[ModelMessage] = []
-    handler.display_system_message("🧵 TaskWeaver Chat - Type 'exit', 'quit', or Ctrl+C to end")
+    try:
+        infer_model(model_name)
+        logger.debug(f"Model provider warmed up: {model_name}")
+    except (UserError, ImportError) as e:
+        # Nothing to keep: the first turn raises the same error to the user
+        logger.warning(f"Model warmup skipped: {e}")
+
+
+def warmup() -> None:
+    """Start loading the configured model's provider on a background thread."""
+    threading.Thread(target=_warm_model, args=(_get_model_name(),), name="taskweaver-model-warmup", daemon=True).start()
+
+
+@lru_cache(maxsize=1)
+def _memory_executor() -> ThreadPoolExecutor:
+    """Single background worker for mem0 initialization (embedding client + Qdrant store).
+
+    Created on first use, so importing this module starts no threads.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="taskweaver-mem0")
+
+
+@lru_cache(maxsize=1)
+def _memory_turn_executor() -> ThreadPoolExecutor:
+    """Two workers so each turn's mem0 add and search overlap instead of running back to back.
+
+    Created on first use, so importing this module starts no threads.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="taskweaver-mem0-turn")
 
-    # Create repository instances for agent tools
-    task_repo = TaskRepository(db_path)
-    dep_repo = TaskDependencyRepository(db_path)
 
-    # Initialize mem0 memory (optional - only if API key available)
+def _load_memory() -> Memory | None:
+    """Initialize mem0 memory, returning None if it is not available."""
     try:
         memory = mem0_memory()
         logger.info("Mem0 memory initialized successfully")
+        return memory
     except (KeyError, RuntimeError) as e:
         # KeyError: Missing API keys (OPENROUTER_API_KEY)
         # RuntimeError: Qdrant file locking issues in CI/CD
         logger.error(f"Mem0 memory not available: {e}")
-        memory = None
+        return None
+
+
+def _search_memories(memory: Memory, user_id: str, query: str) -> str:
+    """Search mem0 and serialize the results.
+
+    Args:
+        memory: Initialized mem0 memory.
+        user_id: User whose memories are searched.
+        query: Search query, the user's input.
+
+    Returns:
+        JSON string of the search results.
+
+    """
+    return orjson.dumps(memory.search(query, user_id=user_id)).decode()
+
+
+def _memory_changed(add_result: object) -> bool:
+    """Tell whether a mem0 add stored, updated or deleted anything.
+
+    mem0 reports one {"event": ...} entry per affected memory; "NONE" means the
+    input was already known. Unrecognized results are treated as changes.
+    """
+    if not isinstance(add_result, dict):
+        return True
+    return any(item.get("event") != "NONE" for item in add_result.get("results", ()))
+
+
+@lru_cache(maxsize=4)
+def _get_repos(db_path: Path) -> tuple[TaskRepository, TaskDependencyRepository]:
+    """Get the task and dependency repositories for a database, built once per path.
+
+    Args:
+        db_path: Path to the task database.
+
+    Returns:
+        Tuple of (task repository, dependency repository).
+
+    """
+    return TaskRepository(db_path), TaskDependencyRepository(db_path)
+
+
+def prepare_dependencies(db_path: Path) -> tuple[TaskDependencies, Future[Memory | None]]:
+    """Create the repositories and start loading the memory used by a chat session.
+
+    Memory initialization runs on a background thread so it overlaps with the
+    user typing the first message.
+
+    Args:
+        db_path: Path to the task database for agent operations.
+
+    Returns:
+        Tuple of the agent dependencies container and a future resolving to the
+        mem0 memory (None if memory is not available).
+
+    """
+    # Initialize mem0 memory in the background (optional - only if API key available)
+    memory_future = _memory_executor().submit(_load_memory)
+
+    # Repository instances for agent tools (shared across chat sessions on the same database)
+    task_repo, dep_repo = _get_repos(db_path)
 
     # Wrap repositories and memory in dependencies container
     dependencies = TaskDependencies(
@@ -146,38 +273,109 @@ def run_chat(handler: ChatHandler, db_path: Path) -> None:
         memories="",
         user_id="default",
     )
+    return dependencies, memory_future
+
+
+def _await_memory(memory_future: Future[Memory | None]) -> Memory | None:
+    """Wait up to MEMORY_INIT_TIMEOUT_S for background mem0 initialization.
+
+    Memory is optional: a slow or failed initialization only costs this turn its memories.
+
+    Args:
+        memory_future: Future returned by prepare_dependencies.
+
+    Returns:
+        Initialized memory, or None if it is unavailable, still initializing or failed.
+
+    """
+    try:
+        return memory_future.result(timeout=MEMORY_INIT_TIMEOUT_S)
+    except TimeoutError:
+        logger.warning("Mem0 memory still initializing, continuing this turn without memory")
+    except Exception as e:  # noqa: BLE001 - any initialization failure degrades to no memory
+        logger.error(f"Mem0 memory initialization failed, continuing this turn without memory: {e}")
+    return None
+
+
+def _update_memories(
+    memory: Memory, dependencies: TaskDependencies, user_input: str, search_cache: dict[tuple[str, str], str]
+) -> None:
+    """Store the user input in mem0 and load related memories into the dependencies.
+
+    The add and search run concurrently: the search only needs past memories.
+    Search results are reused for repeated inputs until an add changes the stored
+    memories, which empties the cache.
+
+    Args:
+        memory: Initialized mem0 memory.
+        dependencies: Agent dependencies whose memories are refreshed.
+        user_input: The user's message for this turn.
+        search_cache: Session-scoped search results keyed by (user_id, query).
+
+    """
+    add_future = _memory_turn_executor().submit(memory.add, user_input, user_id=dependencies.user_id)
+    key = (dependencies.user_id, user_input)
+    if (memories := search_cache.get(key)) is None:
+        memories = _memory_turn_executor().submit(_search_memories, memory, *key).result()
+        search_cache[key] = memories
+    dependencies.memories = memories
+    logger.info(f"Retrieved memories:{dependencies.memories}")
+    # Wait for the add so the next turn's search sees this input
+    added = add_future.result()
+    logger.info(f"Memory added: {added}")
+    if _memory_changed(added):
+        search_cache.clear()
+
+
+def run_chat(handler: ChatHandler, db_path: Path) -> None:
+    """Run interactive chat loop with the orchestrator agent.
+
+    Args:
+        handler: ChatHandler implementation for I/O operations.
+        db_path: Path to the task database for agent operations.
+
+    """
+    logger.info(f"Starting chat session with database: {db_path}")
+    handler.display_system_message(f"Current database path: {db_path}")
+    message_history: list[ModelMessage] = []
+    handler.display_system_message("🧵 TaskWeaver Chat - Type 'exit', 'quit', or Ctrl+C to end")
+
+    # Load memory in the background while the user types
+    agent = build_orchestrator_agent()
+    dependencies, memory_future = prepare_dependencies(db_path)
+    memory: Memory | None = None
+    # Per-session mem0 search results, dropped whenever an add changes the memories
+    search_cache: dict[tuple[str, str], str] = {}
 
     turn_count = 0
     while True:
         user_input = handler.get_user_input()
-        command = False
         if user_input is None:
             logger.info(f"Chat session ended after {turn_count} turns")
             break
         if not (stripped_input := user_input.strip()):
             continue
 
+        # Commands and short replies ("ok", "thanks") are not worth a mem0 add + search
+        use_memory = not stripped_input.startswith("/") and len(stripped_input) > SHORT_INPUT_MAX_LENGTH
+
+        # Pick up memory once background initialization finishes (instant after first resolve)
+        if use_memory and memory is None:
+            memory = _await_memory(memory_future)
+
         try:
             if stripped_input.startswith("/github"):
                 config: Config = get_config()
-                stripped_input += f"Open Issues: {
-                    json.dumps(
-                        get_github_issues(config.github_repos),
-                        indent=2,
-                        default=str,  # Handles datetime, UUID, etc.
-                    )
-                }"
-                # No memory addition if commands are used
-                command = True
-
-            # Add user input to memory if available
-            if memory is not None and not command:
-                memory_added = memory.add(stripped_input, user_id=dependencies.user_id)
-                logger.info(f"Memory added: {memory_added}")
-                dependencies.memories = json.dumps(memory.search(stripped_input, user_id=dependencies.user_id))
-                logger.info(f"Retrieved memories:{dependencies.memories}")
-
-            result: AgentRunResult[str] = orchestrator_agent.run_sync(
+                payload = issues_payload(get_github_issues(config.github_repos))
+                stripped_input = f"{stripped_input}\nOpen Issues: {payload}"
+
+            # Add user input to memory and search past memories if available
+            if memory is not None and use_memory:
+                _update_memories(memory, dependencies, stripped_input, search_cache)
+            elif not use_memory:
+                logger.debug("Skipping mem0 for command/short turn")
+
+            result: AgentRunResult[str] = agent.run_sync(
                 stripped_input,
                 message_history=message_history,
                 deps=dependencies,
@@ -185,6 +383,13 @@ def run_chat(handler: ChatHandler, db_path: Path) -> None:
             handler.display_agent_message(result.output)
             message_history = result.all_messages()
             turn_count += 1
+        except _RECOVERABLE_ERRORS as e:
+            # Keep the session (history, warm model, memory) and let the user retry
+            logger.error(f"Chat error on turn {turn_count}: {e}")
+            handler.display_error(str(e))
+        except KeyboardInterrupt:
+            logger.info(f"Chat session interrupted after {turn_count} turns")
+            break
         except Exception as e:
             logger.error(f"Chat error on turn {turn_count}: {e}")
             handler.display_error(str(e))
@@ -1,11 +1,12 @@
 """Shared fixtures for agents tests."""
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
-from pydantic_ai import Agent
 
 # Set dummy API keys BEFORE importing task_agent to prevent client initialization errors
 os.environ.setdefault("OPENAI_API_KEY", "sk-test-dummy-key-for-testing")
@@ -42,16 +43,46 @@ class MockChatHandler:
         return result
 
 
+@dataclass(slots=True)
+class FakeResult:
+    """Stub AgentRunResult exposing what run_chat reads."""
+
+    output: str
+    messages: list = field(default_factory=list)
+
+    def all_messages(self) -> list:
+        return self.messages
+
+
+class FakeAgent:
+    """Stub orchestrator agent recording run_sync calls.
+
+    Responses are returned in order (exceptions are raised); the last one repeats.
+    """
+
+    def __init__(self) -> None:
+        self.model = None
+        self.responses: list[FakeResult | Exception] = [FakeResult("")]
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def run_sync(self, user_prompt: str, **kwargs: Any) -> FakeResult:
+        self.calls.append((user_prompt, kwargs))
+        response = self.responses[min(len(self.calls), len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
 @pytest.fixture
-def mock_agent(monkeypatch: pytest.MonkeyPatch) -> Mock:
-    """Mock orchestrator agent to avoid API calls.
+def mock_agent(monkeypatch: pytest.MonkeyPatch) -> FakeAgent:
+    """Stub orchestrator agent to avoid API calls.
 
-    Patches the module-level orchestrator_agent instance following
-    PydanticAI's recommended pattern of global agent instantiation.
+    Patches the lazily built, shared orchestrator agent returned by
+    build_orchestrator_agent.
 
     """
-    agent = Mock(spec=Agent)
-    monkeypatch.setattr(task_agent, "orchestrator_agent", agent)
+    agent = FakeAgent()
+    monkeypatch.setattr(task_agent, "build_orchestrator_agent", lambda: agent)
     return agent
 
 
@@ -77,7 +108,10 @@ def mock_handler() -> type[MockChatHandler]:
     return MockChatHandler
 
 
-@pytest.fixture
-def db_path(tmp_path: Path) -> Path:
-    """Provide temporary database path."""
-    return tmp_path / "test.db"
+@pytest.fixture(scope="session")
+def db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a temporary database path shared by the session.
+
+    The agent is stubbed in these tests, so the database is never created or written.
+    """
+    return tmp_path_factory.mktemp("db") / "test.db"
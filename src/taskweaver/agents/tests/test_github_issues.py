@@ -0,0 +1,190 @@
+"""Tests for github_issues module."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from taskweaver.agents import github_issues
+
+from ..github_issues import _build_issues_query, get_github_issues, issues_payload
+
+
+@pytest.fixture(autouse=True)
+def clear_issues_cache() -> None:
+    """Start every test with an empty issues cache."""
+    github_issues._ISSUES_CACHE.clear()
+
+
+def _page(titles: list[str], cursor: str | None = None) -> dict:
+    """Build one GraphQL issues page for a repository alias."""
+    return {
+        "issues": {
+            "nodes": [{"title": title, "body": f"{title} body"} for title in titles],
+            "pageInfo": {"endCursor": cursor, "hasNextPage": cursor is not None},
+        }
+    }
+
+
+class TestBuildIssuesQuery:
+    """Tests for _build_issues_query function."""
+
+    def test_aliases_each_repository(self) -> None:
+        """Test one aliased selection and variable set per repository."""
+        query = _build_issues_query(2)
+        assert "r0: repository(owner: $owner0, name: $name0)" in query
+        assert "r1: repository(owner: $owner1, name: $name1)" in query
+        assert "$after1: String" in query
+
+
+class TestGetGithubIssues:
+    """Tests for get_github_issues function."""
+
+    @pytest.fixture
+    def requester(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Patch Github client so GraphQL queries hit a mock requester."""
+        monkeypatch.setenv("GITHUB_TOKEN", "ghp-test")
+        requester = Mock()
+        monkeypatch.setattr(github_issues, "Github", Mock(return_value=Mock(requester=requester)))
+        return requester
+
+    def test_empty_repo_list(self, requester: Mock) -> None:
+        """Test no request is made without repositories."""
+        assert get_github_issues([]) == []
+        requester.graphql_query.assert_not_called()
+
+    def test_batches_repositories_in_one_query(self, requester: Mock) -> None:
+        """Test all repositories are fetched with a single GraphQL request."""
+        requester.graphql_query.return_value = ({}, {"data": {"r0": _page(["a"]), "r1": _page(["b"])}})
+
+        issues = get_github_issues(["owner/one", "owner/two"])
+
+        assert issues == [{"title": "a", "body": "a body"}, {"title": "b", "body": "b body"}]
+        assert requester.graphql_query.call_count == 1
+        variables = requester.graphql_query.call_args[0][1]
+        assert variables["owner1"] == "owner"
+        assert variables["name1"] == "two"
+
+    def test_follows_cursor_only_for_unfinished_repos(self, requester: Mock) -> None:
+        """Test pagination re-queries only repositories with a next page."""
+        requester.graphql_query.side_effect = [
+            ({}, {"data": {"r0": _page(["a"]), "r1": _page(["b"], cursor="c1")}}),
+            ({}, {"data": {"r0": _page(["c"])}}),
+        ]
+
+        issues = get_github_issues(["owner/one", "owner/two"])
+
+        expected_requests = 2
+        assert [issue["title"] for issue in issues] == ["a", "b", "c"]
+        assert requester.graphql_query.call_count == expected_requests
+        variables = requester.graphql_query.call_args_list[1][0][1]
+        assert variables == {"owner0": "owner", "name0": "two", "after0": "c1"}
+
+    def test_skips_null_repository_alias(self, requester: Mock) -> None:
+        """Test a repository GraphQL could not resolve is skipped instead of failing the fetch."""
+        requester.graphql_query.return_value = ({}, {"data": {"r0": None, "r1": _page(["b"])}, "errors": [{}]})
+
+        issues = get_github_issues(["owner/missing", "owner/two"])
+
+        assert issues == [{"title": "b", "body": "b body"}]
+
+    def test_reuses_cached_issues_within_ttl(self, requester: Mock) -> None:
+        """Test a repeated fetch of the same repos is served from cache."""
+        requester.graphql_query.return_value = ({}, {"data": {"r0": _page(["a"]), "r1": _page(["b"])}})
+
+        first = get_github_issues(["owner/one", "owner/two"])
+        second = get_github_issues(["owner/two", "owner/one"])
+
+        assert first == second
+        assert requester.graphql_query.call_count == 1
+
+    def test_refetches_after_ttl(self, requester: Mock, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an expired cache entry triggers a new fetch."""
+        requester.graphql_query.return_value = ({}, {"data": {"r0": _page(["a"])}})
+        clock = iter([0.0, github_issues.ISSUES_CACHE_TTL_S + 1])
+        monkeypatch.setattr(github_issues, "monotonic", lambda: next(clock))
+
+        get_github_issues(["owner/one"])
+        get_github_issues(["owner/one"])
+
+        expected_requests = 2
+        assert requester.graphql_query.call_count == expected_requests
+
+
+class TestGetGithubIssuesRest:
+    """Tests for the unauthenticated REST fallback."""
+
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> Mock:
+        """Patch Github client with a mock REST client."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        client = Mock()
+        monkeypatch.setattr(github_issues, "Github", Mock(return_value=client))
+        return client
+
+    def test_flattens_issues_in_repo_order(self, client: Mock) -> None:
+        """Test concurrent per-repo results are flattened in input order."""
+        repos = {
+            "owner/one": Mock(
+                open_issues_count=1, get_issues=Mock(return_value=[Mock(title="a", body="x", pull_request=None)])
+            ),
+            "owner/two": Mock(
+                open_issues_count=1, get_issues=Mock(return_value=[Mock(title="b", body=None, pull_request=None)])
+            ),
+        }
+        client.get_repo.side_effect = repos.__getitem__
+
+        issues = get_github_issues(["owner/one", "owner/two"])
+
+        assert issues == [{"title": "a", "body": "x"}, {"title": "b", "body": None}]
+
+    def test_excludes_pull_requests(self, client: Mock) -> None:
+        """Test pull requests listed by the REST endpoint are dropped, matching GraphQL."""
+        items = [Mock(title="issue", body=None, pull_request=None), Mock(title="pr", body=None, pull_request=Mock())]
+        client.get_repo.return_value = Mock(open_issues_count=2, get_issues=Mock(return_value=items))
+
+        assert get_github_issues(["owner/repo"]) == [{"title": "issue", "body": None}]
+
+    def test_requests_full_pages(self, client: Mock) -> None:
+        """Test REST client is built with the maximum page size."""
+        client.get_repo.return_value = Mock(open_issues_count=0)
+
+        get_github_issues(["owner/repo"])
+
+        max_page_size = 100
+        github_issues.Github.assert_called_once_with(per_page=max_page_size)  # type: ignore[attr-defined]
+
+    def test_skips_listing_repos_without_open_issues(self, client: Mock) -> None:
+        """Test repositories with no open issues are not paginated."""
+        repo = Mock(open_issues_count=0)
+        client.get_repo.return_value = repo
+
+        assert get_github_issues(["owner/empty"]) == []
+        repo.get_issues.assert_not_called()
+
+
+class TestIssuesPayload:
+    """Tests for issues_payload function."""
+
+    def test_small_payload_kept_whole(self) -> None:
+        """Test issue lists under the budget are serialized in full."""
+        assert issues_payload([{"title": "a", "body": None}]) == '[{"title":"a","body":null}]'
+
+    def test_large_payload_paged(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test issues past the size budget are counted and reachable through the next offset."""
+        monkeypatch.setattr(github_issues, "MAX_ISSUES_PAYLOAD_CHARS", 100)
+        issues = [{"title": f"issue {i}", "body": "x" * 10} for i in range(5)]
+
+        payload = issues_payload(issues)
+
+        assert payload.startswith('[{"title":"issue 0"')
+        assert '"issue 1"' in payload
+        assert '"issue 2"' not in payload
+        assert payload.endswith("(3 more issues omitted; call list_github_issues_tool with offset=2 to read them)")
+        assert issues_payload(issues, offset=4) == '[{"title":"issue 4","body":"xxxxxxxxxx"}]'
+
+    def test_oversized_issue_still_advances(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a single issue larger than the budget is sent alone instead of stalling the paging."""
+        monkeypatch.setattr(github_issues, "MAX_ISSUES_PAYLOAD_CHARS", 10)
+        issues = [{"title": "big", "body": "x" * 50}, {"title": "next", "body": None}]
+
+        assert "offset=1" in issues_payload(issues)
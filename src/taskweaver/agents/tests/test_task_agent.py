@@ -1,13 +1,22 @@
 """Tests for task_agent module."""
 
+import os
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+from pydantic_ai.exceptions import UnexpectedModelBehavior
 
 from taskweaver.agents import task_agent
 
-from ..task_agent import load_prompt, run_chat
+from ..task_agent import (
+    _warm_model,
+    build_orchestrator_agent,
+    load_prompt,
+    prepare_dependencies,
+    run_chat,
+)
+from .conftest import FakeResult
 
 
 class TestLoadPrompt:
@@ -28,47 +37,102 @@ class TestLoadPrompt:
         finally:
             task_agent.PROMPTS_DIR = original
 
+    def test_load_prompt_rereads_modified_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a cached prompt is refreshed when the file changes on disk."""
+        monkeypatch.setattr(task_agent, "PROMPTS_DIR", tmp_path)
+        prompt_file = tmp_path / "test_prompt.md"
+        prompt_file.write_text("v1", encoding="utf-8")
+        assert load_prompt("test_prompt") == "v1"
+
+        prompt_file.write_text("v2", encoding="utf-8")
+        os.utime(prompt_file, ns=(0, prompt_file.stat().st_mtime_ns + 1))
+
+        assert load_prompt("test_prompt") == "v2"
+
     def test_load_prompt_file_not_found(self) -> None:
         """Test loading a non-existent prompt file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_prompt("nonexistent_prompt")
 
 
+class TestPrepareDependencies:
+    """Tests for prepare_dependencies function."""
+
+    def test_memory_unavailable(self, monkeypatch: pytest.MonkeyPatch, db_path: Path) -> None:
+        """Test missing mem0 credentials degrade to no memory."""
+        monkeypatch.setattr(task_agent, "mem0_memory", Mock(side_effect=KeyError("OPENROUTER_API_KEY")))
+
+        dependencies, memory_future = prepare_dependencies(db_path)
+
+        assert memory_future.result(timeout=1) is None
+        assert dependencies.task_repo.db_path == db_path
+        assert dependencies.memories == ""
+
+    @pytest.mark.usefixtures("mock_mem0_memory")
+    def test_reuses_repositories_per_database(self, db_path: Path) -> None:
+        """Test repeated sessions on one database share repository instances."""
+        first, _ = prepare_dependencies(db_path)
+        second, _ = prepare_dependencies(db_path)
+
+        assert first.task_repo is second.task_repo
+        assert first.dep_repo is second.dep_repo
+
+
+class TestBuildOrchestratorAgent:
+    """Tests for build_orchestrator_agent function."""
+
+    def test_builds_agent_once(self) -> None:
+        """Test the agent is constructed on first use and then shared."""
+        assert build_orchestrator_agent() is build_orchestrator_agent()
+
+
+class TestWarmModel:
+    """Tests for _warm_model function."""
+
+    def test_resolves_provider_without_touching_agent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test warmup resolves a throwaway model and leaves the shared agent unresolved."""
+        infer = Mock()
+        monkeypatch.setattr(task_agent, "infer_model", infer)
+
+        _warm_model("openai:gpt-4o-mini")
+
+        infer.assert_called_once_with("openai:gpt-4o-mini")
+        assert isinstance(build_orchestrator_agent().model, str)
+
+
 @pytest.mark.usefixtures("mock_mem0_memory")
 class TestRunChat:
     """Tests for run_chat function."""
 
-    def test_exits_on_none_input(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
-        """Test chat exits when handler returns None."""
-        handler = mock_handler([None])
+    @pytest.mark.parametrize(
+        "inputs",
+        [[None], ["", "   ", "\t", None]],
+        ids=["none_input", "empty_input"],
+    )
+    def test_no_agent_turn(self, inputs, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
+        """Test chat exits on None and skips empty/whitespace-only inputs without running the agent."""
+        handler = mock_handler(inputs)
         run_chat(handler, db_path)  # type: ignore[arg-type]
         expected_system_messages = 2  # Welcome + goodbye
         assert len(handler.system_messages) == expected_system_messages
-        assert mock_agent.run_sync.call_count == 0
-
-    def test_skips_empty_input(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
-        """Test chat skips empty/whitespace-only inputs."""
-        handler = mock_handler(["", "   ", "\t", None])
-        run_chat(handler, db_path)  # type: ignore[arg-type]
-        assert mock_agent.run_sync.call_count == 0
+        assert mock_agent.calls == []
 
     def test_processes_user_input(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
         """Test chat processes valid user input."""
-        mock_result = Mock(output="Hello, user!", all_messages=lambda: [Mock(), Mock()])
-        mock_agent.run_sync.return_value = mock_result
+        mock_agent.responses = [FakeResult("Hello, user!", [object(), object()])]
 
         handler = mock_handler(["Hello, agent!", None])
         run_chat(handler, db_path)  # type: ignore[arg-type]
 
-        assert mock_agent.run_sync.call_count == 1
-        assert mock_agent.run_sync.call_args[0][0] == "Hello, agent!"
+        assert len(mock_agent.calls) == 1
+        assert mock_agent.calls[0][0] == "Hello, agent!"
         assert handler.agent_messages[0] == "Hello, user!"
 
     def test_maintains_message_history(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
         """Test chat maintains message history across turns."""
-        mock_agent.run_sync.side_effect = [
-            Mock(output="Response 1", all_messages=lambda: [Mock(), Mock()]),
-            Mock(output="Response 2", all_messages=lambda: [Mock(), Mock(), Mock(), Mock()]),
+        mock_agent.responses = [
+            FakeResult("Response 1", [object(), object()]),
+            FakeResult("Response 2", [object(), object(), object(), object()]),
         ]
 
         handler = mock_handler(["First", "Second", None])
@@ -77,13 +141,70 @@ class TestRunChat:
         expected_turns = 2
         first_turn_messages = 0  # First turn has no history
         second_turn_messages = 2  # Second turn has 2 messages from first turn
-        assert mock_agent.run_sync.call_count == expected_turns
-        assert len(mock_agent.run_sync.call_args_list[0][1]["message_history"]) == first_turn_messages
-        assert len(mock_agent.run_sync.call_args_list[1][1]["message_history"]) == second_turn_messages
+        assert len(mock_agent.calls) == expected_turns
+        assert len(mock_agent.calls[0][1]["message_history"]) == first_turn_messages
+        assert len(mock_agent.calls[1][1]["message_history"]) == second_turn_messages
+
+    def test_adds_and_searches_memory(self, mock_agent, mock_handler, mock_mem0_memory, db_path):  # type: ignore[no-untyped-def]
+        """Test each turn stores the input in mem0 and injects search results."""
+        memory = Mock(search=Mock(return_value={"results": [{"memory": "likes tea"}]}))
+        mock_mem0_memory.return_value = memory
+        handler = mock_handler(["Remember that I like tea", None])
+        run_chat(handler, db_path)  # type: ignore[arg-type]
+
+        memory.add.assert_called_once_with("Remember that I like tea", user_id="default")
+        memory.search.assert_called_once_with("Remember that I like tea", user_id="default")
+        deps = mock_agent.calls[-1][1]["deps"]
+        assert deps.memories == '{"results":[{"memory":"likes tea"}]}'
+
+    @pytest.mark.usefixtures("mock_agent")
+    def test_reuses_search_for_repeated_input(self, mock_handler, mock_mem0_memory, db_path):  # type: ignore[no-untyped-def]
+        """Test an identical prompt is answered from the search cache while memories are unchanged."""
+        memory = Mock(search=Mock(return_value=[]), add=Mock(return_value={"results": []}))
+        mock_mem0_memory.return_value = memory
+        handler = mock_handler(["What is blocking me?", "What is blocking me?", None])
+        run_chat(handler, db_path)  # type: ignore[arg-type]
+
+        expected_adds = 2
+        assert memory.add.call_count == expected_adds
+        memory.search.assert_called_once()
+
+    @pytest.mark.usefixtures("mock_agent")
+    def test_search_cache_invalidated_by_add(self, mock_handler, mock_mem0_memory, db_path):  # type: ignore[no-untyped-def]
+        """Test a repeated prompt searches again once an add stored a new memory."""
+        added = {"results": [{"id": "1", "memory": "likes tea", "event": "ADD"}]}
+        memory = Mock(search=Mock(return_value=[]), add=Mock(return_value=added))
+        mock_mem0_memory.return_value = memory
+        handler = mock_handler(["What is blocking me?", "What is blocking me?", None])
+        run_chat(handler, db_path)  # type: ignore[arg-type]
+
+        expected_searches = 2
+        assert memory.search.call_count == expected_searches
+
+    def test_continues_without_memory_when_init_fails(self, mock_agent, mock_handler, mock_mem0_memory, db_path):  # type: ignore[no-untyped-def]
+        """Test an unexpected mem0 initialization error leaves the turn without memory."""
+        mock_mem0_memory.side_effect = ValueError("bad qdrant config")
+        mock_agent.responses = [FakeResult("Hello")]
+
+        handler = mock_handler(["Tell me what to do next", None])
+        run_chat(handler, db_path)  # type: ignore[arg-type]
+
+        assert handler.agent_messages == ["Hello"]
+        assert handler.errors == []
+
+    def test_continues_after_recoverable_error(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
+        """Test a model error is reported and the session keeps going."""
+        mock_agent.responses = [UnexpectedModelBehavior("Exceeded maximum retries"), FakeResult("Recovered")]
+
+        handler = mock_handler(["First", "Second", None])
+        run_chat(handler, db_path)  # type: ignore[arg-type]
+
+        assert "Exceeded maximum retries" in handler.errors[0]
+        assert handler.agent_messages == ["Recovered"]
 
     def test_handles_agent_error(self, mock_agent, mock_handler, db_path):  # type: ignore[no-untyped-def]
         """Test chat handles agent errors correctly."""
-        mock_agent.run_sync.side_effect = RuntimeError("API error")
+        mock_agent.responses = [RuntimeError("API error")]
 
         handler = mock_handler(["Cause error"])
         with pytest.raises(RuntimeError, match="API error"):
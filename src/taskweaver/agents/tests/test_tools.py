@@ -0,0 +1,57 @@
+"""Tests for agent tools."""
+
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from pydantic_ai.exceptions import ModelRetry
+
+from taskweaver.database.exceptions import TaskNotFoundError
+from taskweaver.database.repository import TaskRepository
+
+from .. import tools
+from ..tools import create_task_tool, list_github_issues_tool, list_tasks_tool, mark_task_completed_tool
+
+
+def test_create_task_rejects_invalid_fields(tmp_path: Path) -> None:
+    """Test field constraints are still enforced when creating through the tool."""
+    ctx = Mock()
+    ctx.deps.task_repo = TaskRepository(tmp_path / "tasks.db")
+
+    with pytest.raises(ModelRetry, match="duration_min"):
+        create_task_tool(ctx, "Write docs", duration_min=0, llm_value=50.0, requirement="Docs merged")
+
+
+def test_mark_completed_returns_confirmation() -> None:
+    """Test the confirmation message names the task."""
+    ctx = Mock()
+    ctx.deps.task_repo.mark_completed.return_value = Mock(title="Write docs")
+
+    assert mark_task_completed_tool(ctx, uuid4()) == "✅ Task 'Write docs' marked as completed"
+
+
+def test_missing_task_becomes_model_retry() -> None:
+    """Test repository errors are translated into ModelRetry for the LLM."""
+    task_id = uuid4()
+    ctx = Mock()
+    ctx.deps.task_repo.mark_completed.side_effect = TaskNotFoundError(task_id)
+
+    with pytest.raises(ModelRetry, match=str(task_id)) as exc_info:
+        mark_task_completed_tool(ctx, task_id)
+
+    assert isinstance(exc_info.value.__cause__, TaskNotFoundError)
+
+
+def test_unknown_status_becomes_model_retry() -> None:
+    """Test an invalid status filter asks the LLM to retry."""
+    with pytest.raises(ModelRetry, match="Unknown status: done"):
+        list_tasks_tool(Mock(), status="done")
+
+
+def test_list_github_issues_pages_from_offset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the issues tool returns the page starting at the requested offset."""
+    issues = [{"title": "first", "body": None}, {"title": "second", "body": None}]
+    monkeypatch.setattr(tools, "get_github_issues", Mock(return_value=issues))
+
+    assert list_github_issues_tool(Mock(), offset=1) == '[{"title":"second","body":null}]'
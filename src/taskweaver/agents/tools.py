@@ -9,23 +9,79 @@ Error Handling Strategy:
 - The LLM receives the error message and can retry with corrected parameters
 """
 
+from collections.abc import Callable
+from functools import wraps
 from uuid import UUID
 
 from pydantic import ValidationError
 from pydantic_ai import RunContext
 from pydantic_ai.exceptions import ModelRetry
 
+from taskweaver.config import get_config
 from taskweaver.database.exceptions import DependencyError, TaskNotFoundError
 from taskweaver.database.models import TaskDependency, TaskWithDependencies, TaskWithPriority
 
 from ..database.models import Task, TaskCreate, TaskStatus, TaskUpdate
 from .dependencies import TaskDependencies
+from .github_issues import get_github_issues, issues_payload
 
 # Display constants
 MAX_TITLE_LENGTH = 60
 MAX_DESCRIPTION_LENGTH = 40
 
+# Fixed parts of the status-change confirmations returned to the LLM
+_COMPLETED_PREFIX = "✅ Task '"
+_COMPLETED_SUFFIX = "' marked as completed"
+_IN_PROGRESS_PREFIX = "Task '"
+_IN_PROGRESS_SUFFIX = "' marked as in progress"
+_CANCELLED_PREFIX = "❌ Task '"
+_CANCELLED_SUFFIX = "' marked as cancelled"
 
+# Status value -> enum member, built once instead of calling TaskStatus(...) per tool call
+_STATUS_BY_NAME: dict[str, TaskStatus] = {s.value: s for s in TaskStatus}
+
+
+def _parse_status(status: str | None) -> TaskStatus | None:
+    """Parse an optional status string from the LLM.
+
+    Raises:
+        ModelRetry: If the status is not a valid TaskStatus value.
+    """
+    if not status:
+        return None
+    try:
+        return _STATUS_BY_NAME[status]
+    except KeyError:
+        raise ModelRetry(f"Unknown status: {status}. Valid values: {', '.join(_STATUS_BY_NAME)}") from None
+
+
+def _retry[**P, R](*exc_types: type[Exception]) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Translate the given exceptions raised by a tool into ModelRetry.
+
+    The wrapper keeps the tool's signature and docstring, which PydanticAI
+    uses to build the tool schema.
+
+    Args:
+        *exc_types: Exception types the LLM can fix by retrying with other arguments.
+
+    Returns:
+        Decorator applying the translation.
+    """
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return fn(*args, **kwargs)
+            except exc_types as e:
+                raise ModelRetry(str(e)) from e
+
+        return wrapper
+
+    return decorator
+
+
+@_retry(ValidationError, ValueError)
 def create_task_tool(  # noqa: PLR0913
     ctx: RunContext[TaskDependencies],
     title: str,
@@ -57,20 +113,19 @@ def create_task_tool(  # noqa: PLR0913
         >>> create_task_tool(ctx, "Build login feature", 120, 85.0, "OAuth2 implementation", "Implement OAuth2")
         "✅ Created task 'Build login feature' (ID: 123e4567-...)"
     """
-    try:
-        task_data = TaskCreate(
-            title=title,
-            description=description,
-            duration_min=duration_min,
-            llm_value=llm_value,
-            requirement=requirement,
-        )
-        task = ctx.deps.task_repo.create_task(task_data)
-        return f"✅ Created task '{task.title}' (ID: {task.task_id})"
-    except (ValidationError, ValueError) as e:
-        raise ModelRetry(str(e)) from e
-
-
+    # Skip validating here: create_task validates the same constraints when building the Task
+    task_data = TaskCreate.model_construct(
+        title=title,
+        description=description,
+        duration_min=duration_min,
+        llm_value=llm_value,
+        requirement=requirement,
+    )
+    task = ctx.deps.task_repo.create_task(task_data)
+    return f"✅ Created task '{task.title}' (ID: {task.task_id})"
+
+
+@_retry(ValidationError, ValueError, TaskNotFoundError)
 def update_task_tool(  # noqa: PLR0913
     ctx: RunContext[TaskDependencies],
     task_id: UUID,
@@ -99,19 +154,15 @@ def update_task_tool(  # noqa: PLR0913
     Raises:
         ModelRetry: If validation fails or task not found.
     """
-    try:
-        task_status = TaskStatus(status) if status else None
-        task_data = TaskUpdate(
-            title=title,
-            description=description,
-            status=task_status,
-            duration_min=duration_min,
-            llm_value=llm_value,
-            requirement=requirement,
-        )
-        return ctx.deps.task_repo.update_task(task_id, task_data)
-    except (ValidationError, ValueError, TaskNotFoundError) as e:
-        raise ModelRetry(str(e)) from e
+    task_data = TaskUpdate(
+        title=title,
+        description=description,
+        status=_parse_status(status),
+        duration_min=duration_min,
+        llm_value=llm_value,
+        requirement=requirement,
+    )
+    return ctx.deps.task_repo.update_task(task_id, task_data)
 
 
 def list_tasks_tool(ctx: RunContext[TaskDependencies], status: str | None = None) -> list[Task]:
@@ -127,18 +178,21 @@ def list_tasks_tool(ctx: RunContext[TaskDependencies], status: str | None = None
     Returns:
         List of Task objects matching the filter (or all tasks if no filter).
 
+    Raises:
+        ModelRetry: If status is not a valid value. LLM can retry with a valid one.
+
     Example:
         >>> list_tasks_tool(ctx, status="pending")
         [Task(...), Task(...), ...]
     """
     # Parse status string to enum if provided
-    task_status = TaskStatus(status) if status else None
-
-    tasks: list[Task] = ctx.deps.task_repo.list_tasks(status=task_status)
+    task_status = _parse_status(status)
 
-    return tasks
+    # Return repository models as-is: pydantic-ai serializes them once for the LLM
+    return ctx.deps.task_repo.list_tasks(status=task_status)
 
 
+@_retry(TaskNotFoundError)
 def mark_task_completed_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> str:
     """Mark a task as completed.
 
@@ -159,13 +213,11 @@ def mark_task_completed_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -
         >>> mark_task_completed_tool(ctx, UUID("123e4567-e89b-12d3-a456-426614174000"))
         "✅ Task 'Build login feature' marked as completed"
     """
-    try:
-        task = ctx.deps.task_repo.mark_completed(task_id)
-        return f"✅ Task '{task.title}' marked as completed"
-    except TaskNotFoundError as e:
-        raise ModelRetry(str(e)) from e
+    task = ctx.deps.task_repo.mark_completed(task_id)
+    return "".join((_COMPLETED_PREFIX, task.title, _COMPLETED_SUFFIX))
 
 
+@_retry(TaskNotFoundError)
 def mark_task_in_progress_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> str:
     """Mark a task as in progress.
 
@@ -186,13 +238,11 @@ def mark_task_in_progress_tool(ctx: RunContext[TaskDependencies], task_id: UUID)
         >>> mark_task_in_progress_tool(ctx, UUID("123e4567-e89b-12d3-a456-426614174000"))
         "Task 'Build login feature' marked as in progress"
     """
-    try:
-        task = ctx.deps.task_repo.mark_in_progress(task_id)
-        return f"Task '{task.title}' marked as in progress"
-    except TaskNotFoundError as e:
-        raise ModelRetry(str(e)) from e
+    task = ctx.deps.task_repo.mark_in_progress(task_id)
+    return "".join((_IN_PROGRESS_PREFIX, task.title, _IN_PROGRESS_SUFFIX))
 
 
+@_retry(TaskNotFoundError)
 def mark_task_cancelled_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> str:
     """Mark a task as cancelled.
 
@@ -213,11 +263,8 @@ def mark_task_cancelled_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -
         >>> mark_task_cancelled_tool(ctx, UUID("123e4567-e89b-12d3-a456-426614174000"))
         "❌ Task 'Build login feature' marked as cancelled"
     """
-    try:
-        task = ctx.deps.task_repo.mark_cancelled(task_id)
-        return f"❌ Task '{task.title}' marked as cancelled"
-    except TaskNotFoundError as e:
-        raise ModelRetry(str(e)) from e
+    task = ctx.deps.task_repo.mark_cancelled(task_id)
+    return "".join((_CANCELLED_PREFIX, task.title, _CANCELLED_SUFFIX))
 
 
 def get_task_details_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> Task | str:
@@ -257,16 +304,14 @@ def list_open_tasks_dep_count_tool(ctx: RunContext[TaskDependencies]) -> list[Ta
 
     Returns:
         List of TaskWithDependencies objects including active_blocker_count
-        and tasks_blocked_count for each task.
+        and tasks_blocked_count for each task, unblocked tasks first.
 
     Example:
         >>> list_open_tasks_dep_count_tool(ctx)
         [TaskWithDependencies(...), TaskWithDependencies(...), ...]
     """
-    # Get all tasks with dependency counts from tasks_full view
-    all_tasks: list[TaskWithDependencies] = ctx.deps.task_repo.list_tasks_with_deps()
-
-    return all_tasks
+    # Open tasks are filtered and ordered in SQL
+    return ctx.deps.task_repo.list_open_tasks_with_deps()
 
 
 def list_open_tasks_full(ctx: RunContext[TaskDependencies]) -> list[TaskWithPriority]:
@@ -285,6 +330,7 @@ def list_open_tasks_full(ctx: RunContext[TaskDependencies]) -> list[TaskWithPrio
     return ctx.deps.dep_repo.list_tasks_with_priority()
 
 
+@_retry(DependencyError, TaskNotFoundError)
 def add_dependency_tool(ctx: RunContext[TaskDependencies], task_id: UUID, blocker_id: UUID) -> TaskDependency:
     """Create a dependency relationship between two tasks.
 
@@ -307,10 +353,7 @@ def add_dependency_tool(ctx: RunContext[TaskDependencies], task_id: UUID, blocke
         >>> add_dependency_tool(ctx, task_id=UUID(...), blocker_id=UUID(...))
         TaskDependency(task_id=..., blocker_id=..., created_at=...)
     """
-    try:
-        return ctx.deps.dep_repo.add_dependency(task_id, blocker_id)
-    except (DependencyError, TaskNotFoundError) as e:
-        raise ModelRetry(str(e)) from e
+    return ctx.deps.dep_repo.add_dependency(task_id, blocker_id)
 
 
 def get_blockers_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> list[Task]:
@@ -359,6 +402,7 @@ def get_blocked_tool(ctx: RunContext[TaskDependencies], task_id: UUID) -> list[T
     return ctx.deps.dep_repo.get_blocked(task_id)
 
 
+@_retry(DependencyError, TaskNotFoundError)
 def remove_dependency_tool(ctx: RunContext[TaskDependencies], task_id: UUID, blocker_id: UUID) -> str:
     """Remove a dependency relationship between two tasks.
 
@@ -380,8 +424,25 @@ def remove_dependency_tool(ctx: RunContext[TaskDependencies], task_id: UUID, blo
         >>> remove_dependency_tool(ctx, task_id=UUID(...), blocker_id=UUID(...))
         "Dependency between ... and ... removed"
     """
-    try:
-        ctx.deps.dep_repo.remove_dependency(task_id, blocker_id)
-        return f"✅ Dependency removed: {task_id} no longer blocked by {blocker_id}"
-    except (DependencyError, TaskNotFoundError) as e:
-        raise ModelRetry(str(e)) from e
+    ctx.deps.dep_repo.remove_dependency(task_id, blocker_id)
+    return f"✅ Dependency removed: {task_id} no longer blocked by {blocker_id}"
+
+
+def list_github_issues_tool(ctx: RunContext[TaskDependencies], offset: int = 0) -> str:
+    """List open issues of the configured GitHub repositories, one bounded page at a time.
+
+    The /github command inlines the first page only; when issues were omitted,
+    its note gives the offset to pass here for the next page.
+
+    Args:
+        ctx: Runtime context containing TaskDependencies.
+        offset: Index of the first issue to return (0 for the first page).
+
+    Returns:
+        JSON list of issues (title, body), followed by a note with the next
+        offset if more issues remain.
+    """
+    _ = ctx
+    if offset < 0:
+        raise ModelRetry("offset must be >= 0")
+    return issues_payload(get_github_issues(get_config().github_repos), offset)
@@ -1,19 +1,19 @@
 """CLI commands for TaskWeaver."""
 
+from collections.abc import Callable
 from datetime import datetime
+from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Annotated
 from uuid import UUID
 
 import typer
-from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
-from .agents.chat_handler import CliChatHandler
-from .agents.task_agent import run_chat
 from .config import get_paths
-from .database.connection import init_database
+from .database.connection import close_connections, init_database
 from .database.dependency_repository import TaskDependencyRepository
 from .database.models import Task, TaskCreate, TaskStatus, TaskUpdate, TaskWithDependencies
 from .database.repository import TaskRepository
@@ -21,11 +21,90 @@ from .database.repository import TaskRepository
 app = typer.Typer(
     help="🧵 TaskWeaver - AI-powered task organizer with intelligent decomposition",
     add_completion=True,
-    rich_markup_mode="rich",
+    no_args_is_help=True,
+    # Help strings carry no markup, and errors print as plain tracebacks (no Rich rewriting)
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
-console = Console()
+# Emoji are written literally, so skip shortcode scanning and the repr highlighter on every print
+console = Console(highlight=False, emoji=False)
 DEFAULT_DB = get_paths().database_file
 
+# Table columns, computed once from the models
+_TASK_FIELDS: tuple[str, ...] = tuple(Task.model_fields)
+_TASK_DEPS_FIELDS: tuple[str, ...] = tuple(TaskWithDependencies.model_fields)
+
+
+def _format_date(value: object) -> str:
+    """Format a datetime cell as yyyy-mm-dd (other values as str)."""
+    return value.strftime("%Y-%m-%d") if isinstance(value, datetime) else str(value)
+
+
+def _format_enum(value: object) -> str:
+    """Format an enum cell (e.g. TaskStatus) as its value (other values as str)."""
+    return str(value.value) if isinstance(value, Enum) else str(value)
+
+
+# Cell formatter per field; other fields are formatted with str
+_FIELD_FORMATTERS: dict[str, Callable[[object], str]] = {
+    "created_at": _format_date,
+    "updated_at": _format_date,
+    "status": _format_enum,
+}
+
+# Whole-row field readers (one C-level call per task) and per-column cell formatters
+_TASK_GETTER = attrgetter(*_TASK_FIELDS)
+_TASK_DEPS_GETTER = attrgetter(*_TASK_DEPS_FIELDS)
+_TASK_FORMATTERS = tuple(_FIELD_FORMATTERS.get(field, str) for field in _TASK_FIELDS)
+_TASK_DEPS_FORMATTERS = tuple(_FIELD_FORMATTERS.get(field, str) for field in _TASK_DEPS_FIELDS)
+
+# Above this many rows, listings are written as plain TSV instead of a Rich table
+PLAIN_LIST_THRESHOLD = 500
+
+# TSV cell escapes: a tab or newline inside a cell would split columns/rows, so both are
+# written as backslash sequences (and backslash itself is doubled to keep them unambiguous)
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _format_row(values: tuple, formatters: tuple[Callable[[object], str], ...]) -> list[str]:
+    """Format one task's field values as table cells.
+
+    Args:
+        values: Field values in column order.
+        formatters: Cell formatter for each column.
+
+    Returns:
+        Cell strings in column order.
+    """
+    return [fmt(value) for fmt, value in zip(formatters, values, strict=True)]
+
+
+def _print_rows(columns: tuple[str, ...], rows: list[list[str]]) -> None:
+    """Print task rows as a Rich table, or as TSV for very large listings.
+
+    Rich measures every cell to lay out a table, which dominates the command's
+    runtime for thousands of rows; past PLAIN_LIST_THRESHOLD the rows are
+    written straight to the console file instead, with cells escaped (_TSV_ESCAPES).
+
+    Args:
+        columns: Column headers.
+        rows: Formatted cell strings, one list per task.
+    """
+    if len(rows) > PLAIN_LIST_THRESHOLD:
+        out = console.file
+        out.write("\t".join(columns) + "\n")
+        out.writelines("\t".join(cell.translate(_TSV_ESCAPES) for cell in row) + "\n" for row in rows)
+        out.flush()
+    else:
+        table = Table(title="📋 Tasks", show_lines=True)
+        for col in columns:
+            table.add_column(col, header_style="bold blue")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+
+    console.print(f"\n[dim]Total: {len(rows)} task(s)[/dim]")
+
 
 @app.command(name="create", help="Create a new task")
 def create(
@@ -48,6 +127,22 @@ def create(
     console.print(f"✅ Created task: [cyan]{task.task_id}[/cyan] - [bold]{task.title}[/bold]")
 
 
+@app.command(name="bulk-create", help="Create tasks from a JSONL file")
+def bulk_create(
+    source: Annotated[Path, typer.Option("--from", help="JSONL file, one task object per line", exists=True)],
+    db_path: Annotated[Path, typer.Option("--db", help="Database file path")] = DEFAULT_DB,
+) -> None:
+    """Create every task in a JSONL file in a single transaction.
+
+    Each non-blank line is a JSON object with the `create` fields:
+    title, duration_min, llm_value, requirement and optional description.
+    """
+    with source.open("rb") as f:
+        tasks_data = [TaskCreate.model_validate_json(line) for line in f if line.strip()]
+    tasks = TaskRepository(db_path).create_tasks(tasks_data)
+    console.print(f"✅ Created {len(tasks)} task(s)")
+
+
 @app.command(name="ls", help="List all tasks or filter by status")
 def list_tasks(
     status: Annotated[
@@ -57,30 +152,13 @@ def list_tasks(
     db_path: Annotated[Path, typer.Option("--db", help="Database file path")] = DEFAULT_DB,
 ) -> None:
     """List tasks with optional status filter. Use -s to filter by status."""
-    columns = list(Task.model_fields.keys())
-    table = Table(title="📋 Tasks", show_lines=True)
-    for col in columns:
-        table.add_column(col, header_style="bold blue")
-
     task_list = TaskRepository(db_path).list_tasks(status=status)
 
     if not task_list:
         console.print("[yellow]No tasks found[/yellow]")
         return
 
-    for task in task_list:
-        row_values = []
-        for field in columns:
-            value = getattr(task, field)
-            # Format datetime fields as yyyy-mm-dd
-            if field in ("created_at", "updated_at") and isinstance(value, datetime):
-                row_values.append(value.strftime("%Y-%m-%d"))
-            else:
-                row_values.append(str(value))
-        table.add_row(*row_values)
-
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(task_list)} task(s)[/dim]")
+    _print_rows(_TASK_FIELDS, [_format_row(_TASK_GETTER(task), _TASK_FORMATTERS) for task in task_list])
 
 
 @app.command(name="lso", help="List all open tasks")
@@ -88,30 +166,13 @@ def list_open(
     db_path: Annotated[Path, typer.Option("--db", help="Database file path")] = DEFAULT_DB,
 ) -> None:
     """List open tasks with dependency counts."""
-    columns = list(TaskWithDependencies.model_fields.keys())
-    table = Table(title="📋 Tasks", show_lines=True)
-    for col in columns:
-        table.add_column(col, header_style="bold blue")
-
     task_list: list[TaskWithDependencies] = TaskRepository(db_path).list_tasks_with_deps()
 
     if not task_list:
         console.print("[yellow]No tasks found[/yellow]")
         return
 
-    for task in task_list:
-        row_values = []
-        for field in columns:
-            value = getattr(task, field)
-            # Format datetime fields as yyyy-mm-dd
-            if field in ("created_at", "updated_at") and isinstance(value, datetime):
-                row_values.append(value.strftime("%Y-%m-%d"))
-            else:
-                row_values.append(str(value))
-        table.add_row(*row_values)
-
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(task_list)} task(s)[/dim]")
+    _print_rows(_TASK_DEPS_FIELDS, [_format_row(_TASK_DEPS_GETTER(task), _TASK_DEPS_FORMATTERS) for task in task_list])
 
 
 @app.command(name="edit", help="Update an existing task")
@@ -147,19 +208,20 @@ def update(
 
 @app.command(name="rm", help="Delete a task")
 def delete(
-    task_id: Annotated[UUID, typer.Argument(help="Task UUID to delete")],
+    task_ids: Annotated[list[UUID], typer.Argument(help="Task UUID(s) to delete")],
     force: Annotated[bool, typer.Option("--force", "-f", help="Skip confirmation prompt")] = False,
     db_path: Annotated[Path, typer.Option("--db", help="Database file path")] = DEFAULT_DB,
 ) -> None:
-    """Delete a task by UUID. Use -f to skip confirmation."""
+    """Delete one or more tasks by UUID (all or nothing). Use -f to skip confirmation."""
     if not force:
-        confirm = typer.confirm(f"Delete task {task_id}?")
+        confirm = typer.confirm(f"Delete task {', '.join(map(str, task_ids))}?")
         if not confirm:
             console.print("[yellow]Cancelled[/yellow]")
             raise typer.Abort()
 
-    TaskRepository(db_path).delete_task(task_id=task_id)
-    console.print(f"🗑️  Deleted task: [cyan]{task_id}[/cyan]")
+    TaskRepository(db_path).delete_tasks(task_ids)
+    for task_id in task_ids:
+        console.print(f"🗑️  Deleted task: [cyan]{task_id}[/cyan]")
 
 
 @app.command(name="show", help="Show detailed information about a task")
@@ -179,7 +241,7 @@ def show(
     table.add_column("Field", style="bold cyan")
     table.add_column("Value")
 
-    for field in Task.model_fields:
+    for field in _TASK_FIELDS:
         value = getattr(task, field)
         # Format None values
         display_value = "[dim]None[/dim]" if value is None else str(value)
@@ -191,6 +253,11 @@ def show(
 @app.command(name="chat", help="Start interactive conversation with AI agent.")
 def chat(db_path: Annotated[Path, typer.Option("--db", help="Database file path")] = DEFAULT_DB) -> None:
     """Start an interactive conversation with the AI agent."""
+    # Agent stack (pydantic-ai, mem0, qdrant) is only imported when chatting
+    from .agents.chat_handler import CliChatHandler  # noqa: PLC0415
+    from .agents.task_agent import run_chat, warmup  # noqa: PLC0415
+
+    warmup()  # Model provider loads in the background while the session starts
     run_chat(CliChatHandler(), db_path)
 
 
@@ -208,7 +275,11 @@ def restart(
     """
     if delete and db_path.exists():
         console.print(f"[yellow]Deleting existing database: {db_path}[/yellow]")
+        close_connections(db_path)
         db_path.unlink()
+        # Drop WAL sidecar files too, or SQLite would replay them into the new database
+        for suffix in ("-wal", "-shm"):
+            db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
         console.print("[green]Database deleted[/green]")
 
     init_database(db_path=db_path)
@@ -254,7 +325,6 @@ def blockers(
 
 def main() -> None:
     """Main entry point for CLI."""
-    logger.debug("TaskWeaver CLI starting")
     app()
 
 
@@ -10,6 +10,7 @@ Configuration Hierarchy (later overrides earlier):
 
 Environment Variables (.env):
     - Loaded from ./.env (project-local) or ~/.config/taskweaver/.env
+    - Set TASKWEAVER_SKIP_DOTENV=1 to skip loading .env files
     - Provider-specific API keys (see examples below)
 
     OpenAI models (gpt-4o, gpt-4o-mini, etc.):
@@ -24,6 +25,9 @@ Environment Variables (.env):
     Google models (gemini-1.5-flash, etc.):
         GOOGLE_API_KEY=...
 
+    GitHub issue fetching (/github chat command, optional):
+        GITHUB_TOKEN=ghp_...
+
     Note: TaskWeaver uses PydanticAI which requires provider-specific
     environment variables. Set the appropriate key for your model provider.
 
@@ -46,12 +50,18 @@ Directory Structure:
 import os
 import sys
 import tomllib
+from contextlib import suppress
+from dataclasses import dataclass
 from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
+from time import monotonic
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from loguru import logger
-from pydantic import BaseModel, Field
+
+# Files/directories marking a project root
+_PROJECT_MARKERS = frozenset({"pyproject.toml", ".git"})
 
 
 def get_project_root() -> Path | None:
@@ -66,9 +76,11 @@ def get_project_root() -> Path | None:
 
     # Search up to 5 levels
     for _ in range(5):
-        # Check for project markers
-        if (current / "pyproject.toml").exists() or (current / ".git").exists():
-            return current
+        # Check for project markers with one directory listing instead of a stat per marker;
+        # an unreadable directory is skipped and the search continues with its parent
+        with suppress(OSError), os.scandir(current) as entries:
+            if any(entry.name in _PROJECT_MARKERS for entry in entries):
+                return current
 
         parent = current.parent
         if parent == current:  # Reached filesystem root
@@ -128,6 +140,14 @@ class XDGPaths:
         self._data_dir = get_xdg_data_home() / "taskweaver"
         self._cache_dir = get_xdg_cache_home() / "taskweaver"
         self._state_dir = get_xdg_state_home() / "taskweaver"
+        self._created: set[Path] = set()
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory on first access only (later accesses skip the syscalls)."""
+        if path not in self._created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created.add(path)
+        return path
 
     @property
     def project_root(self) -> Path | None:
@@ -137,26 +157,22 @@ class XDGPaths:
     @property
     def config_dir(self) -> Path:
         """Config directory path (creates if missing)."""
-        self._config_dir.mkdir(parents=True, exist_ok=True)
-        return self._config_dir
+        return self._ensure_dir(self._config_dir)
 
     @property
     def data_dir(self) -> Path:
         """Data directory path (creates if missing)."""
-        self._data_dir.mkdir(parents=True, exist_ok=True)
-        return self._data_dir
+        return self._ensure_dir(self._data_dir)
 
     @property
     def cache_dir(self) -> Path:
         """Cache directory path (creates if missing)."""
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        return self._cache_dir
+        return self._ensure_dir(self._cache_dir)
 
     @property
     def state_dir(self) -> Path:
         """State directory path (creates if missing)."""
-        self._state_dir.mkdir(parents=True, exist_ok=True)
-        return self._state_dir
+        return self._ensure_dir(self._state_dir)
 
     @property
     def config_file(self) -> Path:
@@ -206,6 +222,32 @@ class XDGPaths:
         return self.state_dir / "taskweaver.log"
 
 
+# Parsed .env files keyed by path -> (mtime_ns, values)
+_env_cache: dict[Path, tuple[int, dict[str, str]]] = {}
+
+
+def _read_env_file(path: Path) -> dict[str, str] | None:
+    """Parse a .env file, reusing the previous parse while its mtime is unchanged.
+
+    Args:
+        path: .env file to read.
+
+    Returns:
+        Variables defined in the file, or None if it doesn't exist.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if (cached := _env_cache.get(path)) is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    values = {key: value for key, value in dotenv_values(path).items() if value is not None}
+    _env_cache[path] = (mtime_ns, values)
+    return values
+
+
 def _load_env_file() -> None:
     """Load .env file with project-local precedence.
 
@@ -213,47 +255,88 @@ def _load_env_file() -> None:
     1. ./.env (project-local) if exists
     2. ~/.config/taskweaver/.env (XDG) if exists
 
+    Values override existing environment variables. Skipped entirely when
+    TASKWEAVER_SKIP_DOTENV=1 (e.g. CI, where variables are set directly).
+
     Called once during module import.
     """
-    paths = XDGPaths()
+    if os.getenv("TASKWEAVER_SKIP_DOTENV") == "1":
+        return
 
-    # Try project-local .env first
+    paths = XDGPaths()
+    candidates = [paths.config_dir / ".env"]
     if paths.project_root:
-        local_env = paths.project_root / ".env"
-        if local_env.exists():
-            load_dotenv(local_env, override=True)
-            return
+        candidates.insert(0, paths.project_root / ".env")
 
-    # Fall back to XDG .env
-    xdg_env = paths.config_dir / ".env"
-    if xdg_env.exists():
-        load_dotenv(xdg_env, override=True)
+    # First existing file wins (project-local before XDG)
+    for env_file in candidates:
+        if (values := _read_env_file(env_file)) is not None:
+            os.environ.update(values)
+            return
 
 
-class Config(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Config:
     """Application configuration.
 
     Simple, flat configuration structure with sensible defaults.
     Supports any LLM API endpoint (OpenAI, Anthropic, local models, etc.).
+    A plain frozen dataclass: values read from config files are type-checked
+    by the loader (see _validate_config), so construction stays free.
     """
 
-    model: str = Field(
-        default="gpt-4o-mini",
-        description="LLM model name (e.g., gpt-4o-mini, claude-3-5-sonnet-20241022)",
-    )
-    api_endpoint: str = Field(
-        default="https://api.openai.com/v1",
-        description="API endpoint URL (OpenAI, Anthropic, local, or custom)",
-    )
-    auto_decompose: bool = Field(
-        default=True,
-        description="Automatically decompose complex tasks into subtasks",
-    )
-    log_level: str = Field(
-        default="WARNING",
-        description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
-    )
-    github_repos: list[str] = Field(default=[], description="List of repos to get from github")
+    # LLM model name (e.g., gpt-4o-mini, claude-3-5-sonnet-20241022)
+    model: str = "gpt-4o-mini"
+    # API endpoint URL (OpenAI, Anthropic, local, or custom)
+    api_endpoint: str = "https://api.openai.com/v1"
+    # Automatically decompose complex tasks into subtasks
+    auto_decompose: bool = True
+    # Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    log_level: str = "WARNING"
+    # Repos to get from github ("owner/repo"); a tuple, so the shared cached instance can't be mutated
+    github_repos: tuple[str, ...] = ()
+
+
+# Types accepted from config files per key (anything else is ignored); TOML arrays map to tuple
+_CONFIG_TYPES: dict[str, type] = {
+    "model": str,
+    "api_endpoint": str,
+    "auto_decompose": bool,
+    "log_level": str,
+    "github_repos": tuple,
+}
+
+
+def _validate_config(data: dict, path: Path) -> dict:
+    """Check the known keys of one config file against the Config field types.
+
+    Unknown keys are dropped. TOML arrays of strings become tuples.
+
+    Args:
+        data: Parsed TOML data.
+        path: File the data was read from (for error messages).
+
+    Returns:
+        Values for the Config fields defined in the file.
+
+    Raises:
+        TypeError: If a value has the wrong type (e.g. a string for github_repos).
+    """
+    values = {}
+    for key, value in data.items():
+        if (expected := _CONFIG_TYPES.get(key)) is None:
+            continue
+        if expected is tuple:
+            valid = isinstance(value, list) and all(isinstance(item, str) for item in value)
+            expected_name = "an array of strings"
+        else:
+            valid = isinstance(value, expected)
+            expected_name = f"a {'boolean' if expected is bool else 'string'}"
+        if not valid:
+            msg = f"Invalid value for '{key}' in {path}: expected {expected_name}, got {value!r}"
+            raise TypeError(msg)
+        values[key] = tuple(value) if expected is tuple else value
+    return values
 
 
 @lru_cache
@@ -272,8 +355,64 @@ def get_paths() -> XDGPaths:
     return XDGPaths()
 
 
-@lru_cache
-def get_config() -> Config:
+# Parsed configs keyed by the (path, mtime_ns) of every config file that existed
+_config_cache: dict[tuple[tuple[Path, int], ...], Config] = {}
+
+# Seconds a returned config is reused before the config files are stat'ed again
+CONFIG_RECHECK_INTERVAL_S = 2.0
+
+# Last config returned per XDGPaths instance -> (monotonic check time, config)
+_last_config: dict[XDGPaths, tuple[float, Config]] = {}
+
+# Parsed TOML per file with the digest of the bytes it was parsed from
+_toml_cache: dict[Path, tuple[bytes, dict]] = {}
+
+
+def _load_toml(path: Path) -> dict:
+    """Parse a TOML file, reusing the previous parse when its content is unchanged.
+
+    A new mtime alone (e.g. a checkout or copy that rewrites files) does not
+    trigger re-parsing: the file is re-read and only parsed if its hash differs.
+
+    Args:
+        path: TOML file to load.
+
+    Returns:
+        Parsed TOML data.
+    """
+    body = path.read_bytes()
+    digest = blake2b(body, digest_size=8).digest()
+    if (cached := _toml_cache.get(path)) is not None and cached[0] == digest:
+        return cached[1]
+
+    data = tomllib.loads(body.decode())
+    _toml_cache[path] = (digest, data)
+    return data
+
+
+def _config_files_key(paths: XDGPaths) -> tuple[tuple[Path, int], ...]:
+    """Build the cache key for the config files currently on disk.
+
+    Args:
+        paths: XDG paths locating the XDG and project-local config files.
+
+    Returns:
+        (path, mtime_ns) pairs in precedence order (XDG first, local last).
+    """
+    candidates = [paths.config_dir / "config.toml"]
+    if paths.project_root:
+        candidates.append(paths.project_root / "config.toml")
+
+    key = []
+    for path in candidates:
+        try:
+            key.append((path, path.stat().st_mtime_ns))
+        except FileNotFoundError:
+            continue
+    return tuple(key)
+
+
+def get_config(*, reload: bool = False) -> Config:
     """Get cached configuration instance.
 
     Loads configuration with precedence hierarchy:
@@ -281,9 +420,20 @@ def get_config() -> Config:
         2. XDG user config (~/.config/taskweaver/config.toml)
         3. Project-local config (./config.toml) - overrides above
 
+    The result is cached per set of config files and their modification times,
+    so files are only re-parsed after they change (e.g. edited during `chat`).
+    Files are stat'ed at most once per CONFIG_RECHECK_INTERVAL_S, so frequent
+    callers get the cached instance without touching the filesystem.
+
+    Args:
+        reload: Check the config files now, ignoring the recheck interval.
+
     Returns:
         Cached Config instance with merged preferences.
 
+    Raises:
+        TypeError: If a config file value has the wrong type.
+
     Example:
         >>> from taskweaver.config import get_config
         >>> config = get_config()
@@ -291,29 +441,20 @@ def get_config() -> Config:
         'gpt-4o-mini'
     """
     paths = get_paths()
-
-    # Start with defaults
-    config_data: dict = {}
-
-    # Load XDG config if it exists
-    xdg_config = paths.config_dir / "config.toml"
-    if xdg_config.exists():
-        with xdg_config.open("rb") as f:
-            config_data = tomllib.load(f)
-
-    # Load project-local config if it exists (overrides XDG)
-    if paths.project_root:
-        local_config = paths.project_root / "config.toml"
-        if local_config.exists():
-            with local_config.open("rb") as f:
-                local_data = tomllib.load(f)
-                # Merge: local overrides XDG (flat structure)
-                config_data.update(local_data)
-
-    if not config_data:
-        return Config()
-
-    return Config(**config_data)
+    now = monotonic()
+    if not reload and (last := _last_config.get(paths)) is not None and now - last[0] < CONFIG_RECHECK_INTERVAL_S:
+        return last[1]
+
+    key = _config_files_key(paths)
+    if (config := _config_cache.get(key)) is None:
+        # Start with defaults; later files override earlier ones (flat structure)
+        config_data: dict = {}
+        for path, _ in key:
+            config_data.update(_validate_config(_load_toml(path), path))
+        config = _config_cache[key] = Config(**config_data)
+
+    _last_config[paths] = (now, config)
+    return config
 
 
 # Load .env file when module is imported
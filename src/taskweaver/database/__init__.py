@@ -1,6 +1,6 @@
 """Database module for TaskWeaver."""
 
-from .connection import get_connection, init_database
+from .connection import get_connection, get_read_connection, init_database
 from .exceptions import TaskNotFoundError
 from .models import Task, TaskCreate, TaskStatus, TaskUpdate
 from .repository import TaskRepository
@@ -13,5 +13,6 @@ __all__ = [
     "TaskStatus",
     "TaskUpdate",
     "get_connection",
+    "get_read_connection",
     "init_database",
 ]
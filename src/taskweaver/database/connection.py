@@ -1,17 +1,25 @@
 """Database connection management for SQLite and Qdrant."""
 
+from __future__ import annotations
+
+import atexit
 import os
+import queue
 import sqlite3
+import threading
 from collections.abc import Generator
-from contextlib import closing, contextmanager
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID
 
 from loguru import logger
-from mem0 import Memory
-from qdrant_client import QdrantClient
 
 from ..config import get_paths
+from .migrations import execute_script, read_schema_version, upgrade_schema
 from .schema import (
+    CREATE_DEPENDENCY_COUNT_TRIGGERS,
     CREATE_DEPENDENCY_INDEX_BLOCKER,
     CREATE_DEPENDENCY_INDEX_TASK,
     CREATE_DEPENDENCY_TABLE,
@@ -24,72 +32,285 @@ from .schema import (
     SCHEMA_VERSION,
 )
 
-# Default database locations (XDG-compliant)
-DEFAULT_DB_PATH = get_paths().database_file
-DEFAULT_QDRANT_PATH = get_paths().qdrant_dir
+if TYPE_CHECKING:
+    # Heavy imports, deferred to the functions that use them (task CRUD never needs them)
+    from mem0 import Memory
+    from qdrant_client import QdrantClient
 
 
-def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
-    """Initialize database with schema.
+def default_db_path() -> Path:
+    """Return the default SQLite database file (XDG-compliant).
+
+    Resolved on first use instead of at import, so importing the package
+    touches neither the filesystem nor the environment.
+    """
+    return get_paths().database_file
+
+
+def default_qdrant_path() -> Path:
+    """Return the default Qdrant storage directory (XDG-compliant)."""
+    return get_paths().qdrant_dir
+
+
+# Current schema DDL, run as one script (the parameterized version INSERT stays separate)
+_INIT_DDL = "\n".join(
+    (
+        CREATE_TASKS_TABLE,
+        CREATE_TASKS_INDEX_ID,
+        CREATE_TASKS_INDEX_STATUS,
+        CREATE_SCHEMA_VERSION_TABLE,
+        CREATE_DEPENDENCY_TABLE,
+        CREATE_DEPENDENCY_INDEX_TASK,
+        CREATE_DEPENDENCY_INDEX_BLOCKER,
+        CREATE_DEPENDENCY_COUNT_TRIGGERS,
+        CREATE_VIEW_TASKS_FULL,
+    )
+)
+
+
+# UUIDs are stored as their 16 raw bytes: callers bind uuid.bytes explicitly (no global
+# sqlite3 adapter, which would leak into every other sqlite3 user in the process) and
+# columns declared "UUID" are converted back (see schema.py)
+@lru_cache(maxsize=4096)
+def _uuid_from_bytes(value: bytes) -> UUID:
+    """Convert a stored UUID column back to UUID.
+
+    Cached: joined rows repeat the same ids (one blocker across many blocked
+    rows), and UUID objects are immutable so they can be shared.
+    """
+    return UUID(bytes=value)
+
+
+sqlite3.register_converter("UUID", _uuid_from_bytes)
+
+
+# Connection tuning: WAL lets readers run alongside a writer, synchronous=NORMAL is safe
+# under WAL and skips the per-commit fsync, the rest trade a little memory for fewer I/Os
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply journal and performance PRAGMAs to a new connection.
+
+    Args:
+        conn: Freshly opened SQLite connection (no transaction in progress).
+
+    """
+    # journal_mode must be set outside a transaction; it persists in the database file
+    journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    if journal_mode != "wal":
+        logger.warning(f"SQLite WAL mode unavailable, using journal_mode={journal_mode}")
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+
+# Idle connections kept per database file: readers run concurrently, SQLite allows one writer
+POOL_SIZE = 4
+WRITE_POOL_SIZE = 1
+
+# Prepared statements cached per pooled connection: the module-level SQL constants plus
+# their per-batch-size placeholder variants stay parsed for the life of the connection
+STATEMENT_CACHE_SIZE = 256
+
+
+class SQLiteConnectionPool:
+    """Reusable SQLite connections for one database file.
+
+    Connections are opened on demand with the row factory and PRAGMAs applied
+    once, then returned to the pool instead of being closed (up to `size` idle).
+    Idle connections are reused most-recent first, so the connection handed
+    out is the one whose page cache is warmest. Read-only pools set
+    `query_only`, so a stray write fails instead of taking the database write lock.
+    """
+
+    def __init__(self, db_path: Path, size: int = POOL_SIZE, *, read_only: bool = False) -> None:
+        """Initialize pool.
+
+        Args:
+            db_path: Path to SQLite database file.
+            size: Maximum number of idle connections kept open.
+            read_only: Open connections with `PRAGMA query_only=1`.
+
+        """
+        self.db_path = db_path
+        self.size = size
+        self.read_only = read_only
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new tuned connection."""
+        # Agent tools may run on worker threads; a connection is only used by one holder at a time.
+        # Autocommit mode: writes open their own transaction through write_tx
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_DECLTYPES,  # "UUID" columns come back as uuid.UUID
+        )
+        conn.row_factory = sqlite3.Row  # Access columns by name
+        _apply_pragmas(conn)
+        if self.read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Generator[sqlite3.Connection]:
+        """Check out a connection, returning it to the pool afterwards.
+
+        Yields:
+            SQLite connection with row factory set.
+
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        except BaseException:
+            # State after a failure is unknown: don't hand this connection out again
+            conn.close()
+            raise
+
+        if conn.in_transaction:
+            conn.rollback()  # Never pool a connection with uncommitted work
+        if self._idle.qsize() < self.size:
+            self._idle.put_nowait(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# Pools keyed by (database file, read_only)
+_pools: dict[tuple[Path, bool], SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+# (db_path, qdrant_path) pairs already checked/initialized by this process
+_verified: set[tuple[Path, Path]] = set()
+
+
+def _get_pool(db_path: Path, *, read_only: bool = False) -> SQLiteConnectionPool:
+    """Get the read or write connection pool for a database file, creating it on first use."""
+    with _pools_lock:
+        if (pool := _pools.get((db_path, read_only))) is None:
+            size = POOL_SIZE if read_only else WRITE_POOL_SIZE
+            pool = _pools[db_path, read_only] = SQLiteConnectionPool(db_path, size, read_only=read_only)
+        return pool
+
+
+def close_connections(db_path: Path) -> None:
+    """Close pooled connections to a database file (e.g. before deleting it).
+
+    Also forgets that the file was verified, so it is re-initialized if removed.
 
     Args:
         db_path: Path to SQLite database file.
 
     """
-    logger.debug(f"Initializing database at: {db_path}")
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with _pools_lock:
+        pools = [_pools.pop((db_path, read_only), None) for read_only in (False, True)]
+        _verified.difference_update({key for key in _verified if key[0] == db_path})
+    for pool in pools:
+        if pool is not None:
+            pool.close()
 
-    with closing(sqlite3.connect(db_path)) as conn:
-        with conn:  # Transaction management
-            # Create tables and indexes separately
-            logger.debug("Creating tasks table")
-            conn.execute(CREATE_TASKS_TABLE)
-            conn.execute(CREATE_TASKS_INDEX_ID)
-            conn.execute(CREATE_TASKS_INDEX_STATUS)
 
-            logger.debug("Creating schema_version table")
-            conn.execute(CREATE_SCHEMA_VERSION_TABLE)
-            conn.execute(INSERT_SCHEMA_VERSION, (SCHEMA_VERSION,))
+@atexit.register
+def _close_all_pools() -> None:
+    """Close every pooled connection at interpreter exit (checkpoints the WAL)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
 
-            logger.debug("Creating dependency table")
-            conn.execute(CREATE_DEPENDENCY_TABLE)
-            conn.execute(CREATE_DEPENDENCY_INDEX_TASK)
-            conn.execute(CREATE_DEPENDENCY_INDEX_BLOCKER)
 
-            logger.debug("Create Views")
-            conn.execute(CREATE_VIEW_TASKS_FULL)
+def init_database(db_path: Path | None = None) -> None:
+    """Initialize database with schema.
 
-            # Transaction auto-commits on successful exit
-        logger.info(f"Database initialized successfully at {db_path} (schema version: {SCHEMA_VERSION})")
+    Creates a new database, or upgrades an existing one to the current schema version.
+
+    Args:
+        db_path: Path to SQLite database file.
+
+    Raises:
+        SchemaVersionError: If an existing database cannot be upgraded.
+
+    """
+    db_path = db_path or default_db_path()
+    logger.debug(f"Initializing database at: {db_path}")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Runs on a pooled writer connection, which later writes to this database reuse.
+    # An existing database is upgraded first; upgrade, DDL and version INSERT share
+    # one transaction, so a failure leaves the database as it was
+    with _get_pool(db_path).acquire() as conn, write_tx(conn):
+        if (version := read_schema_version(conn)) is not None:
+            if version != SCHEMA_VERSION:
+                logger.info(f"Upgrading database schema from version {version} to {SCHEMA_VERSION}: {db_path}")
+            upgrade_schema(conn, version)
+        execute_script(conn, _INIT_DDL)
+        conn.execute(INSERT_SCHEMA_VERSION, (SCHEMA_VERSION,))
+    logger.info(f"Database initialized successfully at {db_path} (schema version: {SCHEMA_VERSION})")
 
 
 def _ensure_databases_exist(db_path: Path, qdrant_path: Path) -> None:
-    """Ensure both SQLite and Qdrant databases exist, initialize if needed.
+    """Ensure both SQLite and Qdrant databases exist, initialize or upgrade if needed.
 
     Args:
         db_path: Path to SQLite database file.
         qdrant_path: Path to Qdrant storage directory.
 
     """
+    key = (db_path, qdrant_path)
+    if key in _verified:
+        return
+
     # Initialize SQLite if missing
     if not db_path.exists():
         logger.debug(f"SQLite database does not exist, initializing: {db_path}")
+        close_connections(db_path)  # Pooled connections would point at the removed file
         init_database(db_path)
+    else:
+        # Databases from an older schema are upgraded once, before first use
+        with _get_pool(db_path).acquire() as conn:
+            version = read_schema_version(conn)
+        if version != SCHEMA_VERSION:
+            init_database(db_path)
 
     # Initialize Qdrant if missing
     if not qdrant_path.exists():
         logger.debug(f"Qdrant directory does not exist, initializing: {qdrant_path}")
         init_qdrant(qdrant_path)
 
+    _verified.add(key)
+
 
 @contextmanager
 def get_connection(
-    db_path: Path = DEFAULT_DB_PATH,
-    qdrant_path: Path = DEFAULT_QDRANT_PATH,
+    db_path: Path | None = None,
+    qdrant_path: Path | None = None,
 ) -> Generator[sqlite3.Connection]:
     """Get database connection as context manager.
 
     Automatically initializes both SQLite and Qdrant if they don't exist.
+    Connections come from a per-database pool and are reused across calls.
+    Use this for writes; pure reads should use get_read_connection.
 
     Args:
         db_path: Path to SQLite database file.
@@ -104,23 +325,76 @@ def get_connection(
         ...     tasks = cursor.fetchall()
 
     """
+    db_path = db_path or default_db_path()
     # Ensure both databases exist before attempting connection
-    _ensure_databases_exist(db_path, qdrant_path)
+    _ensure_databases_exist(db_path, qdrant_path or default_qdrant_path())
+
+    with _get_pool(db_path).acquire() as conn:
+        try:
+            yield conn
+        except Exception as e:
+            logger.error(f"Database operation failed: {e}")
+            raise
+
+
+@contextmanager
+def get_read_connection(
+    db_path: Path | None = None,
+    qdrant_path: Path | None = None,
+) -> Generator[sqlite3.Connection]:
+    """Get a read-only database connection as context manager.
+
+    Same as get_connection, but from a separate pool of `query_only`
+    connections, so readers never queue behind the single writer connection.
+
+    Args:
+        db_path: Path to SQLite database file.
+        qdrant_path: Path to Qdrant storage directory.
+
+    Yields:
+        Read-only SQLite connection with row factory set.
+
+    """
+    db_path = db_path or default_db_path()
+    _ensure_databases_exist(db_path, qdrant_path or default_qdrant_path())
+
+    with _get_pool(db_path, read_only=True).acquire() as conn:
+        try:
+            yield conn
+        except Exception as e:
+            logger.error(f"Database operation failed: {e}")
+            raise
+
+
+@contextmanager
+def write_tx(conn: sqlite3.Connection) -> Generator[sqlite3.Connection]:
+    """Run statements in an explicit write transaction.
+
+    Takes the write lock up front with BEGIN IMMEDIATE, so a concurrent writer
+    waits on busy_timeout here instead of failing mid-transaction. Commits on
+    success and rolls back on any exception.
+
+    Args:
+        conn: Pooled connection (autocommit mode) from get_connection.
+
+    Yields:
+        The same connection, inside the transaction.
+
+    Example:
+        >>> with get_connection() as conn, write_tx(conn):
+        ...     conn.execute("DELETE FROM tasks WHERE status = 'cancelled'")
 
-    logger.debug(f"Opening database connection: {db_path}")
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Access columns by name
+    """
+    conn.execute("BEGIN IMMEDIATE")
     try:
         yield conn
-    except Exception as e:
-        logger.error(f"Database operation failed: {e}")
+    except BaseException:
+        conn.execute("ROLLBACK")
         raise
-    finally:
-        logger.debug("Closing database connection")
-        conn.close()
+    conn.execute("COMMIT")
 
 
-def init_qdrant(qdrant_path: Path = DEFAULT_QDRANT_PATH) -> None:
+def init_qdrant(qdrant_path: Path | None = None) -> None:
     """Initialize Qdrant vector database.
 
     Creates the Qdrant storage directory and initializes the client.
@@ -133,9 +407,12 @@ def init_qdrant(qdrant_path: Path = DEFAULT_QDRANT_PATH) -> None:
         >>> from taskweaver.database.connection import init_qdrant
         >>> init_qdrant()  # Initializes at ~/.local/share/taskweaver/qdrant_store
     """
+    qdrant_path = qdrant_path or default_qdrant_path()
     logger.debug(f"Initializing Qdrant at: {qdrant_path}")
     qdrant_path.mkdir(parents=True, exist_ok=True)
 
+    from qdrant_client import QdrantClient  # noqa: PLC0415
+
     # Verify Qdrant can initialize (creates internal data structures)
     _ = QdrantClient(path=str(qdrant_path))
     logger.info(f"Qdrant initialized successfully at {qdrant_path}")
@@ -143,8 +420,8 @@ def init_qdrant(qdrant_path: Path = DEFAULT_QDRANT_PATH) -> None:
 
 @contextmanager
 def get_qdrant_client(
-    qdrant_path: Path = DEFAULT_QDRANT_PATH,
-    db_path: Path = DEFAULT_DB_PATH,
+    qdrant_path: Path | None = None,
+    db_path: Path | None = None,
 ) -> Generator[QdrantClient]:
     """Get Qdrant client as context manager.
 
@@ -161,10 +438,12 @@ def get_qdrant_client(
         >>> with get_qdrant_client() as client:
         ...     collections = client.get_collections()
     """
+    qdrant_path = qdrant_path or default_qdrant_path()
     # Ensure both databases exist (unified initialization)
-    _ensure_databases_exist(db_path, qdrant_path)
+    _ensure_databases_exist(db_path or default_db_path(), qdrant_path)
+
+    from qdrant_client import QdrantClient  # noqa: PLC0415
 
-    logger.debug(f"Opening Qdrant client: {qdrant_path}")
     client = QdrantClient(path=str(qdrant_path))
     try:
         yield client
@@ -172,18 +451,19 @@ def get_qdrant_client(
         logger.error(f"Qdrant operation failed: {e}")
         raise
     finally:
-        logger.debug("Closing Qdrant client")
         client.close()
 
 
 def mem0_memory() -> Memory:
     """Get mem0 initialized memory."""
+    from mem0 import Memory  # noqa: PLC0415
+
     config = {
         "vector_store": {
             "provider": "qdrant",
             "config": {
                 "collection_name": "test",
-                "path": str(DEFAULT_QDRANT_PATH),
+                "path": str(default_qdrant_path()),
                 "on_disk": True,
             },
         },
@@ -1,31 +1,101 @@
 """Repository for CRUD operations in task_dependency table."""
 
+import sqlite3
 from collections import deque
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from uuid import UUID
 
 from loguru import logger
 
-from .connection import DEFAULT_DB_PATH, get_connection
+from .connection import default_db_path, get_connection, get_read_connection, write_tx
 from .exceptions import DependencyError, TaskNotFoundError
-from .models import TaskDependency, TaskStatus, TaskWithDependencies, TaskWithPriority
-from .repository import Task, TaskRepository
-from .schema import DELETE_DEPENDENCY, INSERT_DEPENDENCY, SELECT_ACTIVE_BLOCKERS, SELECT_BLOCKED_TASKS
+from .models import TaskDependency, TaskStatus, TaskWithPriority
+from .repository import Task, TaskRepository, _task_from_row, _to_micros, _trusted_constructor
+from .schema import (
+    CHECK_CYCLE,
+    CHECK_DEPENDENCY_EXISTS,
+    DELETE_DEPENDENCY,
+    INSERT_DEPENDENCY,
+    SELECT_ACTIVE_BLOCKERS,
+    SELECT_BLOCKED_TASKS,
+    SELECT_DEPENDENCY_EDGES,
+    SELECT_TASK_PRIORITIES,
+    SELECT_TASK_STATUSES,
+    placeholders,
+)
+
+# Statuses a task can't take part in new dependencies with
+_CLOSED_STATUSES = frozenset({TaskStatus.CANCELLED.value, TaskStatus.COMPLETED.value})
+
+_build_task_with_priority = _trusted_constructor(TaskWithPriority)
+
+
+def _propagate_priorities(priorities: dict[UUID, float], edges: Iterable[tuple[UUID, UUID]]) -> dict[UUID, float]:
+    """Push intrinsic priorities upstream through the dependency DAG.
+
+    Iterative Kahn sweep starting from tasks that block nothing: once every task
+    a blocker blocks is final, the blocker's effective priority is final too.
+    O(V + E), no recursion. Tasks on a cycle (prevented on insert) keep the
+    priority gathered so far.
+
+    Args:
+        priorities: Intrinsic priority per task; updated in place.
+        edges: (task_id, blocker_id) pairs.
+
+    Returns:
+        The same dict, holding effective priorities.
+    """
+    blockers_of: dict[UUID, list[UUID]] = {}
+    blocked_count = dict.fromkeys(priorities, 0)
+    for task_id, blocker_id in edges:
+        blockers_of.setdefault(task_id, []).append(blocker_id)
+        blocked_count[blocker_id] += 1
+
+    ready = deque(task_id for task_id, count in blocked_count.items() if not count)
+    while ready:
+        task_id = ready.popleft()
+        priority = priorities[task_id]
+        for blocker_id in blockers_of.get(task_id, ()):
+            priorities[blocker_id] = max(priorities[blocker_id], priority)
+            blocked_count[blocker_id] -= 1
+            if not blocked_count[blocker_id]:
+                ready.append(blocker_id)
+    return priorities
+
+
+def _creates_cycle(conn: sqlite3.Connection, task_id: UUID, blocker_id: UUID) -> bool:
+    """Check whether "task_id blocked by blocker_id" would close a dependency cycle.
+
+    One recursive query walks the active blocking chain upward from blocker_id.
+
+    Args:
+        conn: Open database connection.
+        task_id: Task that would be blocked.
+        blocker_id: Task that would block.
+
+    Returns:
+        True if task_id is reachable from blocker_id (or they are the same task).
+    """
+    cycle = conn.execute(CHECK_CYCLE, (blocker_id.bytes, task_id.bytes)).fetchone() is not None
+    if cycle:
+        logger.warning(f"Circular dependency detected: task-{task_id} -> blocker-{blocker_id}")
+    return cycle
 
 
 class TaskDependencyRepository:
     """Repository for Task Dependency table functions."""
 
-    def __init__(self, db_path: Path = DEFAULT_DB_PATH) -> None:
+    def __init__(self, db_path: Path | None = None) -> None:
         """Initialize repository.
 
         Args:
             db_path: Path to SQLite database file.
 
         """
-        self.db_path = db_path
-        self.task_repository = TaskRepository(db_path=db_path)
-        logger.debug(f"TaskDependencyRepository initialized with database: {db_path}")
+        self.db_path = db_path or default_db_path()
+        self.task_repository = TaskRepository(db_path=self.db_path)
+        logger.debug(f"TaskDependencyRepository initialized with database: {self.db_path}")
 
     def add_dependency(self, task_id: UUID, blocker_id: UUID) -> TaskDependency:
         """Create a dependency between two tasks.
@@ -39,34 +109,65 @@ class TaskDependencyRepository:
 
         Raises:
             TaskNotFoundError: If either task doesn't exist.
-            DependencyError: If either task is already closed (completed/cancelled).
+            DependencyError: If either task is already closed (completed/cancelled),
+                the dependency already exists, or it would create a cycle.
         """
-        try:
-            if any(
-                self.task_repository.get_task(ids).status in ([TaskStatus.CANCELLED.value, TaskStatus.COMPLETED.value])  # type: ignore
-                for ids in [task_id, blocker_id]
-            ):  # type: ignore fail fast
-                raise DependencyError("task is closed")
-        except AttributeError as exc:
-            raise TaskNotFoundError(task_id) from exc
-
-        if self._cycle_check(task_id, blocker_id):
-            raise DependencyError("Dependency causes a cycle")
-
-        dependency = TaskDependency(task_id=task_id, blocker_id=blocker_id)
-        with get_connection(self.db_path) as conn:
-            conn.execute(
+        return self.add_dependencies([(task_id, blocker_id)])[0]
+
+    def add_dependencies(self, pairs: Iterable[tuple[UUID, UUID]]) -> list[TaskDependency]:
+        """Create many dependencies in one transaction (all or nothing).
+
+        Args:
+            pairs: (task_id, blocker_id) pairs: the task is blocked by the blocker.
+
+        Returns:
+            Created TaskDependency objects, in input order.
+
+        Raises:
+            TaskNotFoundError: If any task doesn't exist.
+            DependencyError: If any task is already closed (completed/cancelled),
+                a dependency already exists (or is repeated), or the new
+                dependencies would create a cycle (including a task blocking itself).
+        """
+        dependencies = [TaskDependency(task_id=task_id, blocker_id=blocker_id) for task_id, blocker_id in pairs]
+        ids = list(dict.fromkeys(i for dep in dependencies for i in (dep.task_id, dep.blocker_id)))
+
+        # Rejected up front: the table's CHECK and UNIQUE constraints would raise IntegrityError instead
+        new_pairs: set[tuple[UUID, UUID]] = set()
+        for dep in dependencies:
+            if dep.task_id == dep.blocker_id:
+                raise DependencyError("Dependency causes a cycle")
+            if (dep.task_id, dep.blocker_id) in new_pairs:
+                raise DependencyError(f"Dependency already exists: blocker-{dep.blocker_id} -> task-{dep.task_id}")
+            new_pairs.add((dep.task_id, dep.blocker_id))
+
+        # Validation, inserts and cycle check share one connection and transaction
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            query = SELECT_TASK_STATUSES.format(placeholders=placeholders(len(ids)))
+            statuses = dict(conn.execute(query, [task_id.bytes for task_id in ids]).fetchall())
+            for required_id in ids:
+                if required_id not in statuses:
+                    raise TaskNotFoundError(required_id)
+            if not _CLOSED_STATUSES.isdisjoint(statuses.values()):
+                raise DependencyError("task is closed")  # fail fast
+            for dep in dependencies:
+                if conn.execute(CHECK_DEPENDENCY_EXISTS, (dep.task_id.bytes, dep.blocker_id.bytes)).fetchone():
+                    raise DependencyError(f"Dependency already exists: blocker-{dep.blocker_id} -> task-{dep.task_id}")
+
+            conn.executemany(
                 INSERT_DEPENDENCY,
-                (
-                    str(dependency.dependency_id),
-                    str(dependency.task_id),
-                    str(dependency.blocker_id),
-                    dependency.created_at.isoformat(),
-                ),
+                [
+                    (dep.dependency_id.bytes, dep.task_id.bytes, dep.blocker_id.bytes, _to_micros(dep.created_at))
+                    for dep in dependencies
+                ],
             )
-            conn.commit()
-            logger.info(f"Created dependency: task-{dependency.task_id}, blocker-{dependency.blocker_id}")
-        return dependency
+            # With every new edge in place, any cycle must run through one of them
+            if any(_creates_cycle(conn, dep.task_id, dep.blocker_id) for dep in dependencies):
+                raise DependencyError("Dependency causes a cycle")  # write_tx rolls back the inserts
+
+        for dep in dependencies:
+            logger.info(f"Created dependency: task-{dep.task_id}, blocker-{dep.blocker_id}")
+        return dependencies
 
     def remove_dependency(self, task_id: UUID, blocker_id: UUID) -> None:
         """Remove a dependency between two tasks.
@@ -79,82 +180,71 @@ class TaskDependencyRepository:
             DependencyError: If dependency does not exist.
         """
         logger.debug(f"Removing dependency: task-{task_id}, blocker-{blocker_id}")
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(DELETE_DEPENDENCY, (str(task_id), str(blocker_id)))
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            cursor = conn.execute(DELETE_DEPENDENCY, (task_id.bytes, blocker_id.bytes))
             if not cursor.rowcount:
                 logger.error(f"Cannot remove dependency: not found (task-{task_id}, blocker-{blocker_id})")
                 raise DependencyError(f"Dependency not found: blocker-{blocker_id} -> task-{task_id}")
-            conn.commit()
-            logger.info(f"Removed dependency: task-{task_id}, blocker-{blocker_id}")
+        logger.info(f"Removed dependency: task-{task_id}, blocker-{blocker_id}")
 
-    def get_blockers(self, task_id: UUID) -> list[Task]:
-        """Get all active tasks blocking this task.
+    def iter_blockers(self, task_id: UUID) -> Iterator[Task]:
+        """Iterate over active tasks blocking this task, building each Task on demand.
+
+        Rows are fetched in one go and the read connection is returned to the pool
+        before the first task is yielded, so an abandoned iterator holds no connection.
 
         Args:
             task_id: UUID of the blocked task.
 
-        Returns:
-            List of Task objects that are blocking (status: pending/in_progress).
+        Yields:
+            Task objects that are blocking (status: pending/in_progress).
         """
-        logger.debug(f"Retrieving active blockers for task: {task_id}")
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(SELECT_ACTIVE_BLOCKERS, (str(task_id),))
-            rows = cursor.fetchall()
+        with get_read_connection(self.db_path) as conn:
+            # Blocker rows come back joined with their tasks: one query for all blockers
+            rows = conn.execute(SELECT_ACTIVE_BLOCKERS, (task_id.bytes,)).fetchall()
+        for row in rows:
+            yield _task_from_row(row)
 
-        blockers = [task for row in rows if (task := self.task_repository.get_task(task_id=UUID(row["blocker_id"])))]
-        logger.debug(f"Found {len(blockers)} active blocker(s) for task {task_id}")
-        return blockers
+    def iter_blocked(self, blocker_id: UUID) -> Iterator[Task]:
+        """Iterate over tasks blocked by this task, building each Task on demand.
 
-    def get_blocked(self, blocker_id: UUID) -> list[Task]:
-        """Get all tasks blocked by this task.
+        Rows are fetched in one go and the read connection is returned to the pool
+        before the first task is yielded, so an abandoned iterator holds no connection.
 
         Args:
             blocker_id: UUID of the blocker task.
 
-        Returns:
-            List of Task objects that are blocked by this task.
+        Yields:
+            Task objects that are blocked by this task.
         """
-        logger.debug(f"Retrieving tasks blocked by: {blocker_id}")
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(SELECT_BLOCKED_TASKS, (str(blocker_id),))
-            rows = cursor.fetchall()
+        with get_read_connection(self.db_path) as conn:
+            rows = conn.execute(SELECT_BLOCKED_TASKS, (blocker_id.bytes,)).fetchall()
+        for row in rows:
+            yield _task_from_row(row)
 
-        blocked = [task for row in rows if (task := self.task_repository.get_task(task_id=UUID(row["task_id"])))]
-        logger.debug(f"Found {len(blocked)} blocked task(s) by {blocker_id}")
-        return blocked
+    def get_blockers(self, task_id: UUID) -> list[Task]:
+        """Get all active tasks blocking this task.
 
-    def _cycle_check(self, task_id: UUID, blocker_id: UUID) -> bool:
-        """Detect circular dependencies using BFS.
+        Args:
+            task_id: UUID of the blocked task.
 
-        Checks if blocker_id transitively depends on task_id.
-        If true, adding "task_id blocked by blocker_id" would create a cycle.
+        Returns:
+            List of Task objects that are blocking (status: pending/in_progress).
+        """
+        return list(self.iter_blockers(task_id))
+
+    def get_blocked(self, blocker_id: UUID) -> list[Task]:
+        """Get all tasks blocked by this task.
 
         Args:
-            task_id: Task that would be blocked.
-            blocker_id: Task that would block.
+            blocker_id: UUID of the blocker task.
 
         Returns:
-            True if adding dependency would create a cycle.
+            List of Task objects that are blocked by this task.
         """
-        logger.debug(f"Checking for circular dependency: task-{task_id}, blocker-{blocker_id}")
-        visited: set[UUID] = set()
-        queue: deque[UUID] = deque([blocker_id])
-
-        while queue:
-            current = queue.popleft()
-            if current == task_id:
-                logger.warning(f"Circular dependency detected: task-{task_id} -> blocker-{blocker_id}")
-                return True
-            if current in visited:
-                continue
-            visited.add(current)
-            # Follow the blocking chain upward: who blocks current?
-            queue.extend(blocker.task_id for blocker in self.get_blockers(current))
-
-        logger.debug(f"No circular dependency found for task-{task_id}, blocker-{blocker_id}")
-        return False
-
-    def calculate_effective_priorities(self, tasks: list[TaskWithDependencies] | None = None) -> dict[UUID, float]:
+        return list(self.iter_blocked(blocker_id))
+
+    def calculate_effective_priorities(self, tasks: Iterable[Task] | None = None) -> dict[UUID, float]:
         """Calculate effective priorities for all tasks in batch.
 
         Priority flows upstream: if a high-priority task is blocked by a low-priority task,
@@ -162,10 +252,11 @@ class TaskDependencyRepository:
 
         Formula: effective_priority = max(intrinsic_priority, max(downstream_priorities))
 
-        This method calculates all priorities in a single pass, avoiding redundant calculations.
+        Loads all tasks and dependency edges with two queries, then propagates
+        priorities in a single topological sweep.
 
         Args:
-            tasks: Optional list of tasks to calculate priorities for. If None, uses all tasks.
+            tasks: Optional tasks (any Task model) to calculate priorities for. If None, uses all open tasks.
 
         Returns:
             Dict mapping task_id to effective_priority.
@@ -175,52 +266,20 @@ class TaskDependencyRepository:
             >>> print(f"Task A: {priorities[task_a_id]:.3f}")
             0.90
         """
-        task_repo = TaskRepository(self.db_path)
-        # Import here to avoid circular dependency
-        if tasks is None:
-            tasks = task_repo.list_tasks_with_deps()
-
-        memo: dict[UUID, float] = {}
+        with get_read_connection(self.db_path) as conn:
+            rows = conn.execute(SELECT_TASK_PRIORITIES).fetchall()
+            edges = conn.execute(SELECT_DEPENDENCY_EDGES).fetchall()
+        effective = _propagate_priorities({task_id: priority for task_id, _, priority in rows}, edges)
 
-        def _calculate_recursive(task_id: UUID) -> float:
-            """Recursive helper with memoization."""
-            # Already calculated
-            if task_id in memo:
-                return memo[task_id]
-
-            # Get intrinsic priority
-            task = task_repo.get_task(task_id)
-            if not task:
-                logger.warning(f"Task not found during priority calculation: {task_id}")
-                memo[task_id] = 0.0
-                return 0.0
-
-            intrinsic = task.priority
-
-            # Get tasks this blocks (downstream)
-            blocked_tasks = self.get_blocked(task_id)
-
-            if not blocked_tasks:
-                # Leaf node - no downstream tasks to inherit from
-                memo[task_id] = intrinsic
-                return intrinsic
-
-            # Recursively calculate downstream priorities
-            downstream_priorities = [_calculate_recursive(blocked.task_id) for blocked in blocked_tasks]
-
-            # Inherit max downstream priority
-            effective = max(intrinsic, *downstream_priorities)
-            memo[task_id] = effective
-
-            logger.debug(f"Task {task_id} effective priority: {effective:.3f} (intrinsic: {intrinsic:.3f})")
-            return effective
+        if tasks is None:
+            return {task_id: effective[task_id] for task_id, status, _ in rows if status not in _CLOSED_STATUSES}
 
-        # Calculate for all tasks
+        priorities: dict[UUID, float] = {}
         for task in tasks:
-            if task.task_id not in memo:
-                _calculate_recursive(task.task_id)
-
-        return memo
+            if task.task_id not in effective:
+                logger.warning(f"Task not found during priority calculation: {task.task_id}")
+            priorities[task.task_id] = effective.get(task.task_id, 0.0)
+        return priorities
 
     def list_tasks_with_priority(self, status: TaskStatus | None = None) -> list[TaskWithPriority]:
         """List tasks with dependency counts and effective priorities.
@@ -238,20 +297,14 @@ class TaskDependencyRepository:
             >>> for task in sorted(tasks, key=lambda t: t.effective_priority, reverse=True):
             ...     print(f"{task.title}: {task.effective_priority:.3f}")
         """
-        # Get tasks with dependency counts
-        tasks_with_deps = self.task_repository.list_tasks_with_deps()
-
-        # Filter by status if provided
-        if status:
-            tasks_with_deps = [t for t in tasks_with_deps if t.status == status]
+        # Get tasks with dependency counts (status filter applied in SQL)
+        tasks_with_deps = self.task_repository.list_tasks_with_deps(status)
 
         # Calculate effective priorities for all tasks
-        priorities = self.calculate_effective_priorities(
-            [TaskWithDependencies(**t.model_dump()) for t in tasks_with_deps]
-        )
+        priorities = self.calculate_effective_priorities(tasks_with_deps)
 
         # Build TaskWithPriority models
         return [
-            TaskWithPriority(**task.model_dump(), effective_priority=priorities[task.task_id])
+            _build_task_with_priority(**task.__dict__, effective_priority=priorities[task.task_id])
             for task in tasks_with_deps
         ]
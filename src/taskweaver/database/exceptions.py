@@ -19,7 +19,12 @@ class TaskNotFoundError(Exception):
 
         """
         self.task_id = task_id
-        super().__init__(f"Task not found: {task_id}")
+        # Message is built in __str__, only when the error is actually displayed
+        super().__init__(task_id)
+
+    def __str__(self) -> str:
+        """Return the error message."""
+        return f"Task not found: {self.task_id}"
 
 
 class DependencyError(Exception):
@@ -34,3 +39,17 @@ class DependencyError(Exception):
         """
         self.task_id = task_id
         super().__init__(message)
+
+
+class SchemaVersionError(Exception):
+    """Raised when a database schema cannot be brought to the current version."""
+
+    def __init__(self, message: str, version: int) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message describing the failure.
+            version: Schema version found in the database.
+        """
+        self.version = version
+        super().__init__(message)
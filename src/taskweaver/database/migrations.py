@@ -0,0 +1,207 @@
+"""Versioned upgrades for databases created with an older schema."""
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from .exceptions import SchemaVersionError
+from .schema import SCHEMA_VERSION
+
+# Upgrade scripts keyed by the version they upgrade from (each one moves to version + 1).
+# They only reshape existing tables and data: the current indexes, triggers and views
+# are (re)created by init_database afterwards
+_MIGRATIONS: dict[int, str] = {
+    # 3 -> 4: UUIDs from hyphenated TEXT to their 16 raw bytes. Tables are rebuilt, since
+    # SQLite can't change a column type; the view on tasks is dropped first so the rename succeeds
+    3: """
+    DROP VIEW IF EXISTS tasks_full;
+
+    CREATE TABLE tasks_v4 (
+        task_id UUID PRIMARY KEY,
+        title TEXT NOT NULL CHECK (length(title) <= 500),
+        description TEXT,
+        status TEXT NOT NULL DEFAULT 'pending'
+            CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        duration_min INTEGER NOT NULL,
+        llm_value REAL NOT NULL,
+        requirement TEXT NOT NULL
+    );
+    INSERT INTO tasks_v4
+    SELECT uuid_bytes(task_id), title, description, status, created_at, updated_at,
+        duration_min, llm_value, requirement
+    FROM tasks;
+    DROP TABLE tasks;
+    ALTER TABLE tasks_v4 RENAME TO tasks;
+
+    CREATE TABLE task_dependencies_v4(
+        dependency_id UUID PRIMARY KEY,
+        task_id UUID NOT NULL,
+        blocker_id UUID NOT NULL,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (task_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+        FOREIGN KEY (blocker_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+        UNIQUE(task_id, blocker_id),
+        CHECK(task_id != blocker_id)
+    );
+    INSERT INTO task_dependencies_v4
+    SELECT uuid_bytes(dependency_id), uuid_bytes(task_id), uuid_bytes(blocker_id), created_at
+    FROM task_dependencies;
+    DROP TABLE task_dependencies;
+    ALTER TABLE task_dependencies_v4 RENAME TO task_dependencies;
+    """,
+    # 4 -> 5: timestamps from ISO 8601 TEXT to INTEGER microseconds since the epoch, UTC
+    4: """
+    DROP VIEW IF EXISTS tasks_full;
+
+    CREATE TABLE tasks_v5 (
+        task_id UUID PRIMARY KEY,
+        title TEXT NOT NULL CHECK (length(title) <= 500),
+        description TEXT,
+        status TEXT NOT NULL DEFAULT 'pending'
+            CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        duration_min INTEGER NOT NULL,
+        llm_value REAL NOT NULL,
+        requirement TEXT NOT NULL
+    );
+    INSERT INTO tasks_v5
+    SELECT task_id, title, description, status, iso_micros(created_at), iso_micros(updated_at),
+        duration_min, llm_value, requirement
+    FROM tasks;
+    DROP TABLE tasks;
+    ALTER TABLE tasks_v5 RENAME TO tasks;
+
+    CREATE TABLE task_dependencies_v5(
+        dependency_id UUID PRIMARY KEY,
+        task_id UUID NOT NULL,
+        blocker_id UUID NOT NULL,
+        created_at INTEGER NOT NULL,
+        FOREIGN KEY (task_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+        FOREIGN KEY (blocker_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+        UNIQUE(task_id, blocker_id),
+        CHECK(task_id != blocker_id)
+    );
+    INSERT INTO task_dependencies_v5
+    SELECT dependency_id, task_id, blocker_id, iso_micros(created_at)
+    FROM task_dependencies;
+    DROP TABLE task_dependencies;
+    ALTER TABLE task_dependencies_v5 RENAME TO task_dependencies;
+    """,
+    # 5 -> 6: dependency counts materialized on tasks, backfilled with the counts the old
+    # aggregating tasks_full view computed. The view is dropped so init_database recreates
+    # it over the new columns, with the replaced indexes
+    5: """
+    DROP VIEW IF EXISTS tasks_full;
+    DROP INDEX IF EXISTS idx_tasks_status;
+    DROP INDEX IF EXISTS idx_task_dependencies_blocker;
+
+    ALTER TABLE tasks ADD COLUMN tasks_blocked_count INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE tasks ADD COLUMN active_blocker_count INTEGER NOT NULL DEFAULT 0;
+    UPDATE tasks
+    SET tasks_blocked_count = (
+            SELECT COUNT(*) FROM task_dependencies td WHERE td.blocker_id = tasks.task_id
+        ),
+        active_blocker_count = (
+            SELECT COUNT(*)
+            FROM task_dependencies td
+            JOIN tasks blocker ON td.blocker_id = blocker.task_id
+            WHERE td.task_id = tasks.task_id AND blocker.status IN ('pending', 'in_progress')
+        );
+    """,
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _uuid_bytes(value: str | None) -> bytes | None:
+    """SQL function uuid_bytes(text): the 16 raw bytes of a UUID stored as text."""
+    return None if value is None else UUID(value).bytes
+
+
+def _iso_micros(value: str | None) -> int | None:
+    """SQL function iso_micros(text): microseconds since the epoch of an ISO 8601 timestamp.
+
+    Exact, unlike julianday() arithmetic in floating point. Naive timestamps are taken as UTC.
+    """
+    if value is None:
+        return None
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def read_schema_version(conn: sqlite3.Connection) -> int | None:
+    """Read the schema version of an existing database.
+
+    Args:
+        conn: Connection to the database.
+
+    Returns:
+        Highest applied schema version, 0 for tasks tables without version
+        tracking, or None for an empty database.
+
+    """
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if "schema_version" not in tables:
+        return 0 if "tasks" in tables else None
+    return conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0] or 0
+
+
+def execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Execute a multi-statement script inside the current transaction.
+
+    Unlike Connection.executescript, which commits any open transaction first.
+
+    Args:
+        conn: Connection, usually inside write_tx.
+        script: SQL statements separated by semicolons.
+
+    """
+    for statement in _split_statements(script):
+        conn.execute(statement)
+
+
+def _split_statements(script: str) -> Iterator[str]:
+    """Split a script into complete statements (trigger bodies keep their inner semicolons)."""
+    statement = ""
+    for part in script.split(";"):
+        statement += part + ";"
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+
+
+def upgrade_schema(conn: sqlite3.Connection, version: int, target: int = SCHEMA_VERSION) -> None:
+    """Upgrade an existing database schema one version at a time.
+
+    Runs on the caller's transaction, so a failed step leaves the database untouched.
+
+    Args:
+        conn: Connection inside a write transaction.
+        version: Current schema version of the database.
+        target: Schema version to upgrade to.
+
+    Raises:
+        SchemaVersionError: If the database is newer than `target`, or a step is missing.
+
+    """
+    if version > target:
+        msg = f"Database schema version {version} is newer than supported version {target}; upgrade taskweaver"
+        raise SchemaVersionError(msg, version)
+
+    # Conversions SQLite has no built-in for (unhex() needs SQLite 3.41)
+    conn.create_function("uuid_bytes", 1, _uuid_bytes, deterministic=True)
+    conn.create_function("iso_micros", 1, _iso_micros, deterministic=True)
+    for step in range(version, target):
+        if (script := _MIGRATIONS.get(step)) is None:
+            msg = (
+                f"Database schema version {version} cannot be upgraded to version {target}; "
+                "recreate it with `taskweaver restartDB --delete` (deletes all tasks)"
+            )
+            raise SchemaVersionError(msg, version)
+        execute_script(conn, script)
@@ -117,6 +117,10 @@ class TaskWithDependencies(Task):
         default=0, ge=0, description="Number of active tasks (pending/in_progress) blocking this task"
     )
 
+    model_config = ConfigDict(
+        frozen=True,  # Read-only query results (also for TaskWithPriority): shared, never copied
+    )
+
     @property
     def is_blocked(self) -> bool:
         """Check if this task has any active blockers."""
@@ -1,21 +1,31 @@
 """Task repository for CRUD operations."""
 
-from datetime import UTC, datetime
+import sqlite3
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from uuid import UUID
 
 from loguru import logger
+from pydantic import BaseModel
 
-from .connection import DEFAULT_DB_PATH, get_connection
+from .connection import default_db_path, get_connection, get_read_connection, write_tx
 from .exceptions import TaskNotFoundError
 from .models import Task, TaskCreate, TaskStatus, TaskUpdate, TaskWithDependencies
 from .schema import (
     DELETE_TASK,
+    DELETE_TASKS,
     INSERT_TASK,
     SELECT_ALL_TASKS,
     SELECT_ALL_TASKS_DEPENDENCY,
+    SELECT_OPEN_TASKS_DEPENDENCY,
     SELECT_TASK_BY_ID,
+    SELECT_TASKS_DEPENDENCY_BY_STATUS,
     UPDATE_TASK,
+    UPDATE_TASK_STATUS,
+    placeholders,
 )
 
 
@@ -25,15 +35,15 @@ class TaskRepository:
     Designed for AI agent tool usage with clear, single-purpose methods.
     """
 
-    def __init__(self, db_path: Path = DEFAULT_DB_PATH) -> None:
+    def __init__(self, db_path: Path | None = None) -> None:
         """Initialize repository.
 
         Args:
             db_path: Path to SQLite database file.
 
         """
-        self.db_path = db_path
-        logger.debug(f"TaskRepository initialized with database: {db_path}")
+        self.db_path = db_path or default_db_path()
+        logger.debug(f"TaskRepository initialized with database: {self.db_path}")
 
     def create_task(self, task_data: TaskCreate) -> Task:
         """Create a new task.
@@ -46,34 +56,32 @@ class TaskRepository:
 
         """
         logger.debug(f"Creating task: title='{task_data.title}'")
-        task = Task(
-            title=task_data.title,
-            description=task_data.description,
-            duration_min=task_data.duration_min,
-            llm_value=task_data.llm_value,
-            requirement=task_data.requirement,
-        )
-
-        with get_connection(self.db_path) as conn:
-            conn.execute(
-                INSERT_TASK,
-                (
-                    str(task.task_id),
-                    task.title,
-                    task.description,
-                    task.status.value,
-                    task.created_at.isoformat(),
-                    task.updated_at.isoformat(),
-                    task.duration_min,
-                    task.llm_value,
-                    task.requirement,
-                ),
-            )
-            conn.commit()
-            logger.info(f"Created task {task.task_id}: '{task.title}' [status={task.status.value}]")
+        task = _new_task(task_data)
+
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            conn.execute(INSERT_TASK, _task_params(task))
+        logger.info(f"Created task {task.task_id}: '{task.title}' [status={task.status.value}]")
 
         return task
 
+    def create_tasks(self, tasks_data: Iterable[TaskCreate]) -> list[Task]:
+        """Create many tasks in one transaction.
+
+        Args:
+            tasks_data: Task creation data, one per task.
+
+        Returns:
+            Created tasks with generated IDs and timestamps, in input order.
+
+        """
+        tasks = [_new_task(task_data) for task_data in tasks_data]
+
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            conn.executemany(INSERT_TASK, map(_task_params, tasks))
+        logger.info(f"Created {len(tasks)} tasks")
+
+        return tasks
+
     def get_task(self, task_id: UUID) -> Task | None:
         """Get task by ID.
 
@@ -85,8 +93,8 @@ class TaskRepository:
 
         """
         logger.debug(f"Retrieving task: {task_id}")
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(SELECT_TASK_BY_ID, (str(task_id),))
+        with get_read_connection(self.db_path) as conn:
+            cursor = conn.execute(SELECT_TASK_BY_ID, (task_id.bytes,))
             row = cursor.fetchone()
 
         if row is None:
@@ -94,17 +102,7 @@ class TaskRepository:
             return None
 
         logger.debug(f"Task found: {task_id} - '{row['title']}'")
-        return Task(
-            task_id=UUID(row["task_id"]),
-            title=row["title"],
-            description=row["description"],
-            status=TaskStatus(row["status"]),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            duration_min=row["duration_min"],
-            llm_value=row["llm_value"],
-            requirement=row["requirement"],
-        )
+        return _task_from_row(row)
 
     def list_tasks(self, status: TaskStatus | None = None) -> list[Task]:
         """List tasks, optionally filtered by status.
@@ -119,7 +117,7 @@ class TaskRepository:
         filter_msg = f"status={status.value}" if status else "no filter"
         logger.debug(f"Listing tasks ({filter_msg})")
 
-        with get_connection(self.db_path) as conn:
+        with get_read_connection(self.db_path) as conn:
             if status is None:
                 cursor = conn.execute(SELECT_ALL_TASKS)
             else:
@@ -132,53 +130,49 @@ class TaskRepository:
         task_count = len(rows)
         logger.info(f"Retrieved {task_count} task(s) ({filter_msg})")
 
-        return [
-            Task(
-                task_id=UUID(row["task_id"]),
-                title=row["title"],
-                description=row["description"],
-                status=TaskStatus(row["status"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                duration_min=row["duration_min"],
-                llm_value=row["llm_value"],
-                requirement=row["requirement"],
-            )
-            for row in rows
-        ]
-
-    def list_tasks_with_deps(self) -> list[TaskWithDependencies]:
-        """List all tasks with a count of blockers and blocked.
+        return [_task_from_row(row) for row in rows]
+
+    def list_tasks_with_deps(self, status: TaskStatus | None = None) -> list[TaskWithDependencies]:
+        """List tasks with a count of blockers and blocked.
+
+        Args:
+            status: Optional status filter, applied in SQL. If None, returns all tasks.
 
         Returns:
             list[TaskWithDependencies]: _description_
         """
         logger.debug("Listing dependency tasks")
 
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(SELECT_ALL_TASKS_DEPENDENCY)
+        with get_read_connection(self.db_path) as conn:
+            if status is None:
+                cursor = conn.execute(SELECT_ALL_TASKS_DEPENDENCY)
+            else:
+                cursor = conn.execute(SELECT_TASKS_DEPENDENCY_BY_STATUS, (status.value,))
 
             rows = cursor.fetchall()
 
         task_count = len(rows)
         logger.info(f"Retrieved {task_count} task(s)")
 
-        return [
-            TaskWithDependencies(
-                task_id=UUID(row["task_id"]),
-                title=row["title"],
-                description=row["description"],
-                status=TaskStatus(row["status"]),
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                duration_min=row["duration_min"],
-                llm_value=row["llm_value"],
-                requirement=row["requirement"],
-                tasks_blocked_count=row["tasks_blocked_count"],
-                active_blocker_count=row["active_blocker_count"],
-            )
-            for row in rows
-        ]
+        return [_task_with_deps_from_row(row) for row in rows]
+
+    def list_open_tasks_with_deps(self) -> list[TaskWithDependencies]:
+        """List open tasks with dependency counts, ready tasks first.
+
+        Filtering and ordering happen in SQL, so closed tasks are never loaded.
+
+        Returns:
+            Pending/in-progress tasks ordered by active_blocker_count ascending,
+            then tasks_blocked_count descending.
+        """
+        logger.debug("Listing open dependency tasks")
+
+        with get_read_connection(self.db_path) as conn:
+            rows = conn.execute(SELECT_OPEN_TASKS_DEPENDENCY).fetchall()
+
+        logger.info(f"Retrieved {len(rows)} open task(s)")
+
+        return [_task_with_deps_from_row(row) for row in rows]
 
     def update_task(self, task_id: UUID, task_data: TaskUpdate) -> Task:
         """Update a task.
@@ -195,58 +189,28 @@ class TaskRepository:
 
         """
         logger.debug(f"Updating task: {task_id}")
-        # Get existing task
-        task = self.get_task(task_id)
-        if task is None:
-            logger.error(f"Cannot update task {task_id}: not found")
-            raise TaskNotFoundError(task_id)
-
-        # Track changes for logging
-        changes = []
-        # Update fields
-        if task_data.title is not None:
-            changes.append(f"title: '{task.title}' -> '{task_data.title}'")
-            task.title = task_data.title
-        if task_data.description is not None:
-            changes.append("description updated")
-            task.description = task_data.description
-        if task_data.status is not None:
-            old_status = task.status
-            new_status = task_data.status
-            changes.append(f"status: {old_status} -> {new_status}")
-            task.status = task_data.status
-        if task_data.duration_min is not None:
-            changes.append(f"duration_min: {task.duration_min} -> {task_data.duration_min}")
-            task.duration_min = task_data.duration_min
-        if task_data.llm_value is not None:
-            changes.append(f"llm_value: {task.llm_value} -> {task_data.llm_value}")
-            task.llm_value = task_data.llm_value
-        if task_data.requirement is not None:
-            changes.append(f"requirement: '{task.requirement}' -> '{task_data.requirement}'")
-            task.requirement = task_data.requirement
-
-        task.updated_at = datetime.now(UTC)
-
-        with get_connection(self.db_path) as conn:
-            # Extract status value (handle both TaskStatus enum and string)
-            status_value = task.status
-            conn.execute(
+        # Unset fields are passed as NULL and kept by the query: one statement, no prior SELECT
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            row = conn.execute(
                 UPDATE_TASK,
                 (
-                    task.title,
-                    task.description,
-                    status_value,
-                    task.updated_at.isoformat(),
-                    task.duration_min,
-                    task.llm_value,
-                    task.requirement,
-                    str(task_id),
+                    task_data.title,
+                    task_data.description,
+                    task_data.status,  # Already the plain value (use_enum_values)
+                    _to_micros(datetime.now(UTC)),
+                    task_data.duration_min,
+                    task_data.llm_value,
+                    task_data.requirement,
+                    task_id.bytes,
                 ),
-            )
-            conn.commit()
-            logger.info(f"Updated task {task_id}: {', '.join(changes)}")
+            ).fetchone()
 
-        return task
+        if row is None:
+            logger.error(f"Cannot update task {task_id}: not found")
+            raise TaskNotFoundError(task_id)
+
+        logger.info(f"Updated task {task_id}: {', '.join(task_data.model_dump(exclude_none=True))}")
+        return _task_from_row(row)
 
     def mark_completed(self, task_id: UUID) -> Task:
         """Mark a task as completed.
@@ -262,7 +226,7 @@ class TaskRepository:
 
         """
         logger.debug(f"Marking task as completed: {task_id}")
-        return self.update_task(task_id, TaskUpdate(status=TaskStatus.COMPLETED))
+        return self._set_status(task_id, TaskStatus.COMPLETED)
 
     def mark_in_progress(self, task_id: UUID) -> Task:
         """Mark a task as in progress.
@@ -278,7 +242,7 @@ class TaskRepository:
 
         """
         logger.debug(f"Marking task as in progress: {task_id}")
-        return self.update_task(task_id, TaskUpdate(status=TaskStatus.IN_PROGRESS))
+        return self._set_status(task_id, TaskStatus.IN_PROGRESS)
 
     def mark_cancelled(self, task_id: UUID) -> Task:
         """Mark a task as cancelled.
@@ -294,7 +258,32 @@ class TaskRepository:
 
         """
         logger.debug(f"Marking task as cancelled: {task_id}")
-        return self.update_task(task_id, TaskUpdate(status=TaskStatus.CANCELLED))
+        return self._set_status(task_id, TaskStatus.CANCELLED)
+
+    def _set_status(self, task_id: UUID, status: TaskStatus) -> Task:
+        """Set a task's status in one UPDATE ... RETURNING round trip.
+
+        Args:
+            task_id: Task UUID.
+            status: New status.
+
+        Returns:
+            Updated task.
+
+        Raises:
+            TaskNotFoundError: If task does not exist.
+
+        """
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            params = (status.value, _to_micros(datetime.now(UTC)), task_id.bytes)
+            row = conn.execute(UPDATE_TASK_STATUS, params).fetchone()
+
+        if row is None:
+            logger.error(f"Cannot update task {task_id}: not found")
+            raise TaskNotFoundError(task_id)
+
+        logger.info(f"Updated task {task_id}: status -> {status.value}")
+        return _task_from_row(row)
 
     def delete_task(self, task_id: UUID) -> None:
         """Delete a task.
@@ -307,9 +296,8 @@ class TaskRepository:
 
         """
         logger.debug(f"Deleting task: {task_id}")
-        with get_connection(self.db_path) as conn:
-            cursor = conn.execute(DELETE_TASK, (str(task_id),))
-            conn.commit()
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            cursor = conn.execute(DELETE_TASK, (task_id.bytes,))
             deleted = cursor.rowcount > 0
 
         if deleted:
@@ -317,3 +305,175 @@ class TaskRepository:
         else:
             logger.error(f"Cannot delete task {task_id}: not found")
             raise TaskNotFoundError(task_id)
+
+    def delete_tasks(self, task_ids: Iterable[UUID]) -> None:
+        """Delete many tasks in one statement and transaction.
+
+        All-or-nothing: if any task does not exist, nothing is deleted.
+
+        Args:
+            task_ids: Task UUIDs.
+
+        Raises:
+            TaskNotFoundError: If any task does not exist (the first missing one).
+
+        """
+        ids = list(task_ids)
+        with get_connection(self.db_path) as conn, write_tx(conn):
+            query = DELETE_TASKS.format(placeholders=placeholders(len(ids)))
+            deleted = {row[0] for row in conn.execute(query, [task_id.bytes for task_id in ids])}
+            if missing := [task_id for task_id in ids if task_id not in deleted]:
+                logger.error(f"Cannot delete task {missing[0]}: not found")
+                raise TaskNotFoundError(missing[0])
+        logger.info(f"Deleted {len(deleted)} tasks")
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a datetime to the stored form: integer microseconds since the epoch (UTC)."""
+    return (value.astimezone(UTC) - _EPOCH) // _MICROSECOND
+
+
+# Timestamps repeat across rows created in bulk; converted datetimes are immutable and shared
+@lru_cache(maxsize=4096)
+def _from_micros(value: int) -> datetime:
+    """Convert a stored timestamp back to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _new_task(task_data: TaskCreate) -> Task:
+    """Build a new Task, reading the clock once for both timestamps."""
+    now = datetime.now(UTC)
+    return Task(
+        title=task_data.title,
+        description=task_data.description,
+        duration_min=task_data.duration_min,
+        llm_value=task_data.llm_value,
+        requirement=task_data.requirement,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+# INSERT_TASK fields in column order, read in one C-level call per task
+_TASK_INSERT_FIELDS = attrgetter(
+    "task_id.bytes",
+    "title",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "duration_min",
+    "llm_value",
+    "requirement",
+)
+
+
+def _task_params(task: Task) -> tuple:
+    """Build INSERT_TASK parameters for a task.
+
+    status is a TaskStatus (a str enum) or its str value: both bind as TEXT.
+    """
+    values = _TASK_INSERT_FIELDS(task)
+    created, updated = values[4:6]
+    created_at = _to_micros(created)
+    # New tasks share one timestamp for both fields: convert it once
+    updated_at = created_at if updated == created else _to_micros(updated)
+    return (*values[:4], created_at, updated_at, *values[6:])
+
+
+def _trusted_constructor[M: BaseModel](model: type[M]) -> Callable[..., M]:
+    """Build a constructor for rows whose every field is already validated and supplied.
+
+    Equivalent to model.model_construct for complete field sets, but skips its per-field
+    default resolution loop: the instance state is assigned directly, ~4x faster per row.
+
+    Args:
+        model: Pydantic model without private attributes or extra fields.
+
+    Returns:
+        Function taking all fields as keyword arguments and returning a model instance.
+
+    Raises:
+        TypeError: If the model has private attributes or allows extra fields, whose
+            state this shortcut would leave unset.
+    """
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        msg = f"{model.__name__} has private attributes or extra fields: use model.model_construct instead"
+        raise TypeError(msg)
+
+    fields = frozenset(model.model_fields)
+    new = model.__new__
+    set_attr = object.__setattr__  # Also works on frozen models
+
+    def construct(**values: object) -> M:
+        instance = new(model)
+        set_attr(instance, "__dict__", values)
+        set_attr(instance, "__pydantic_fields_set__", set(fields))
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+# Stored status value -> member: reads return TaskStatus, as create_task does
+_STATUS_BY_VALUE: dict[str, TaskStatus] = {status.value: status for status in TaskStatus}
+
+_build_task = _trusted_constructor(Task)
+_build_task_with_deps = _trusted_constructor(TaskWithDependencies)
+
+
+def _task_from_row(row: sqlite3.Row) -> Task:
+    """Build a Task from a tasks row.
+
+    Rows were validated on the way in, so the model is constructed without
+    re-validation. status is mapped to its TaskStatus member with a plain dict lookup.
+    Columns are unpacked by position (tasks column order), which is much cheaper
+    than one name lookup per field.
+    """
+    task_id, title, description, status, created_at, updated_at, duration_min, llm_value, requirement = row[:9]
+    return _build_task(
+        task_id=task_id,
+        title=title,
+        description=description,
+        status=_STATUS_BY_VALUE[status],
+        created_at=_from_micros(created_at),
+        updated_at=_from_micros(updated_at),
+        duration_min=duration_min,
+        llm_value=llm_value,
+        requirement=requirement,
+    )
+
+
+def _task_with_deps_from_row(row: sqlite3.Row) -> TaskWithDependencies:
+    """Build a TaskWithDependencies from a tasks_full row (trusted, not re-validated, by position)."""
+    (
+        task_id,
+        title,
+        description,
+        status,
+        created_at,
+        updated_at,
+        duration_min,
+        llm_value,
+        requirement,
+        tasks_blocked_count,
+        active_blocker_count,
+    ) = row
+    return _build_task_with_deps(
+        task_id=task_id,
+        title=title,
+        description=description,
+        status=_STATUS_BY_VALUE[status],
+        created_at=_from_micros(created_at),
+        updated_at=_from_micros(updated_at),
+        duration_min=duration_min,
+        llm_value=llm_value,
+        requirement=requirement,
+        tasks_blocked_count=tasks_blocked_count,
+        active_blocker_count=active_blocker_count,
+    )
@@ -1,20 +1,31 @@
 """Database schema definitions and queries."""
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 6
 
-# Schema creation SQL
+
+def placeholders(count: int) -> str:
+    """Build the "?, ?, ..." parameter list for a bulk query's {placeholders}."""
+    return ", ".join("?" * count)
+
+
+# Schema creation SQL. UUID columns hold the 16 raw bytes of the UUID (a BLOB);
+# queries bind uuid.bytes and connections convert the declared "UUID" type back to uuid.UUID.
+# Timestamps (*_at) are INTEGER microseconds since the Unix epoch, UTC.
+# Row helpers in repository.py unpack tasks rows by position: keep this column order
 CREATE_TASKS_TABLE = """
 CREATE TABLE IF NOT EXISTS tasks (
-    task_id TEXT PRIMARY KEY,
+    task_id UUID PRIMARY KEY,
     title TEXT NOT NULL CHECK (length(title) <= 500),
     description TEXT,
     status TEXT NOT NULL DEFAULT 'pending'
         CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
     duration_min INTEGER NOT NULL,
     llm_value REAL NOT NULL,
-    requirement TEXT NOT NULL
+    requirement TEXT NOT NULL,
+    tasks_blocked_count INTEGER NOT NULL DEFAULT 0,
+    active_blocker_count INTEGER NOT NULL DEFAULT 0
 );
 """
 
@@ -22,8 +33,9 @@ CREATE_TASKS_INDEX_ID = """
 CREATE INDEX IF NOT EXISTS idx_tasks_task ON tasks(task_id);
 """
 
+# Status filter plus newest-first order: filtered listings scan the index in order, no sort step
 CREATE_TASKS_INDEX_STATUS = """
-CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks(status, created_at DESC);
 """
 
 
@@ -54,23 +66,44 @@ SELECT_ALL_TASKS = """
 SELECT * FROM tasks ORDER BY created_at DESC;
 """
 
+# NULL parameters keep the current value, so a partial update needs no prior SELECT
 UPDATE_TASK = """
 UPDATE tasks
-SET title = ?, description = ?, status = ?, updated_at = ?, duration_min = ?, llm_value = ?, requirement = ?
-WHERE task_id = ?;
+SET title = COALESCE(?, title),
+    description = COALESCE(?, description),
+    status = COALESCE(?, status),
+    updated_at = ?,
+    duration_min = COALESCE(?, duration_min),
+    llm_value = COALESCE(?, llm_value),
+    requirement = COALESCE(?, requirement)
+WHERE task_id = ?
+RETURNING *;
+"""
+
+UPDATE_TASK_STATUS = """
+UPDATE tasks
+SET status = ?, updated_at = ?
+WHERE task_id = ?
+RETURNING *;
 """
 
 DELETE_TASK = """
 DELETE FROM tasks WHERE task_id = ?;
 """
 
+# Bulk queries: {placeholders} is filled with one "?" per id
+DELETE_TASKS = """
+DELETE FROM tasks WHERE task_id IN ({placeholders})
+RETURNING task_id;
+"""
+
 # Task Dependency CRUD queries
 CREATE_DEPENDENCY_TABLE = """
 CREATE TABLE IF NOT EXISTS task_dependencies(
-    dependency_id TEXT PRIMARY KEY,
-    task_id TEXT NOT NULL,
-    blocker_id TEXT NOT NULL,
-    created_at TEXT NOT NULL,
+    dependency_id UUID PRIMARY KEY,
+    task_id UUID NOT NULL,
+    blocker_id UUID NOT NULL,
+    created_at INTEGER NOT NULL,
     FOREIGN KEY (task_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
     FOREIGN KEY (blocker_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
     UNIQUE(task_id, blocker_id),
@@ -82,8 +115,10 @@ CREATE_DEPENDENCY_INDEX_TASK = """
 CREATE INDEX IF NOT EXISTS idx_task_dependencies_task ON task_dependencies(task_id);
 """
 
+# Covering index for lookups by blocker: the blocked task_id is read from the index itself.
+# Lookups by task_id are covered by the UNIQUE(task_id, blocker_id) autoindex
 CREATE_DEPENDENCY_INDEX_BLOCKER = """
-CREATE INDEX IF NOT EXISTS idx_task_dependencies_blocker ON task_dependencies(blocker_id);
+CREATE INDEX IF NOT EXISTS idx_task_dependencies_blocker_task ON task_dependencies(blocker_id, task_id);
 """
 
 INSERT_DEPENDENCY = """
@@ -102,13 +137,15 @@ ORDER BY created_at;
 """
 
 SELECT_BLOCKED_TASKS = """
-SELECT task_id FROM task_dependencies
-WHERE blocker_id = ?
-ORDER BY created_at;
+SELECT t.*
+FROM task_dependencies td
+JOIN tasks t ON td.task_id = t.task_id
+WHERE td.blocker_id = ?
+ORDER BY td.created_at;
 """
 
 SELECT_ACTIVE_BLOCKERS = """
-SELECT td.blocker_id as blocker_id
+SELECT t.*
 FROM task_dependencies td
 JOIN tasks t ON td.blocker_id = t.task_id
 WHERE td.task_id = ?
@@ -116,6 +153,39 @@ AND t.status IN ('pending', 'in_progress')
 ORDER BY td.created_at;
 """
 
+SELECT_TASK_STATUSES = """
+SELECT task_id, status FROM tasks WHERE task_id IN ({placeholders});
+"""
+
+# Is the task (2nd param) reachable from blocker (1st param) through active blockers?
+# UNION (not UNION ALL) drops already-visited ids, so existing cycles terminate
+CHECK_CYCLE = """
+WITH RECURSIVE reachable(id) AS (
+    SELECT ?
+    UNION
+    SELECT td.blocker_id
+    FROM task_dependencies td
+    JOIN reachable r ON td.task_id = r.id
+    JOIN tasks t ON td.blocker_id = t.task_id
+    WHERE t.status IN ('pending', 'in_progress')
+)
+SELECT 1 FROM reachable WHERE id = ? LIMIT 1;
+"""
+
+# Inputs for effective priority propagation: intrinsic priority (llm_value / duration_min)
+# per task, and every dependency edge between existing tasks. Foreign keys aren't enforced,
+# so deleting a task can leave orphaned dependency rows behind: the joins skip them
+SELECT_TASK_PRIORITIES = """
+SELECT task_id, status, llm_value / duration_min FROM tasks;
+"""
+
+SELECT_DEPENDENCY_EDGES = """
+SELECT td.task_id, td.blocker_id
+FROM task_dependencies td
+JOIN tasks t ON td.task_id = t.task_id
+JOIN tasks blocker ON td.blocker_id = blocker.task_id;
+"""
+
 DELETE_DEPENDENCY = """
 DELETE FROM task_dependencies
 WHERE task_id = ? AND blocker_id = ?;
@@ -126,27 +196,74 @@ SELECT dependency_id FROM task_dependencies
 WHERE task_id = ? AND blocker_id = ?;
 """
 
+# Dependency counts are materialized on tasks and kept current by triggers, so listings
+# read plain columns instead of aggregating task_dependencies on every query:
+# - tasks_blocked_count: dependencies naming the task as blocker
+# - active_blocker_count: dependencies of the task whose blocker exists and is open
+CREATE_DEPENDENCY_COUNT_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS trg_dependency_insert_counts
+AFTER INSERT ON task_dependencies
+BEGIN
+    UPDATE tasks SET tasks_blocked_count = tasks_blocked_count + 1 WHERE task_id = NEW.blocker_id;
+    UPDATE tasks SET active_blocker_count = active_blocker_count + 1
+    WHERE task_id = NEW.task_id
+        AND EXISTS (SELECT 1 FROM tasks WHERE task_id = NEW.blocker_id AND status IN ('pending', 'in_progress'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_dependency_delete_counts
+AFTER DELETE ON task_dependencies
+BEGIN
+    UPDATE tasks SET tasks_blocked_count = tasks_blocked_count - 1 WHERE task_id = OLD.blocker_id;
+    UPDATE tasks SET active_blocker_count = active_blocker_count - 1
+    WHERE task_id = OLD.task_id
+        AND EXISTS (SELECT 1 FROM tasks WHERE task_id = OLD.blocker_id AND status IN ('pending', 'in_progress'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_task_status_counts
+AFTER UPDATE OF status ON tasks
+WHEN (OLD.status IN ('pending', 'in_progress')) != (NEW.status IN ('pending', 'in_progress'))
+BEGIN
+    UPDATE tasks
+    SET active_blocker_count = active_blocker_count
+        + CASE WHEN NEW.status IN ('pending', 'in_progress') THEN 1 ELSE -1 END
+    WHERE task_id IN (SELECT task_id FROM task_dependencies WHERE blocker_id = NEW.task_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_task_delete_counts
+AFTER DELETE ON tasks
+WHEN OLD.status IN ('pending', 'in_progress')
+BEGIN
+    UPDATE tasks SET active_blocker_count = active_blocker_count - 1
+    WHERE task_id IN (SELECT task_id FROM task_dependencies WHERE blocker_id = OLD.task_id);
+END;
+"""
+
 CREATE_VIEW_TASKS_FULL = """
 CREATE VIEW IF NOT EXISTS tasks_full AS
-SELECT
-    t.*,
-    COALESCE(n_blocked.blocked_count, 0) as tasks_blocked_count,
-    COALESCE(n_blocker.blocker_count, 0) as active_blocker_count
-FROM tasks as t
-LEFT JOIN (
-    SELECT blocker_id, COUNT(*) as blocked_count
-    FROM task_dependencies
-    GROUP BY blocker_id
-) as n_blocked ON t.task_id = n_blocked.blocker_id
-LEFT JOIN (
-    SELECT td.task_id as blocked_id, COUNT(*) as blocker_count
-    FROM task_dependencies td
-    JOIN tasks blocker ON td.blocker_id = blocker.task_id
-    WHERE blocker.status IN ('pending', 'in_progress')
-    GROUP BY td.task_id
-) as n_blocker ON t.task_id = n_blocker.blocked_id
-WHERE t.status IN ('pending', 'in_progress')
+SELECT * FROM tasks
+WHERE status IN ('pending', 'in_progress')
 """
+# Listings project the TaskWithDependencies columns explicitly, so view changes can't widen them
 SELECT_ALL_TASKS_DEPENDENCY = """
-SELECT * FROM tasks_full ORDER BY created_at DESC;
+SELECT
+    task_id, title, description, status, created_at, updated_at, duration_min, llm_value, requirement,
+    tasks_blocked_count, active_blocker_count
+FROM tasks_full ORDER BY created_at DESC;
+"""
+
+SELECT_TASKS_DEPENDENCY_BY_STATUS = """
+SELECT
+    task_id, title, description, status, created_at, updated_at, duration_min, llm_value, requirement,
+    tasks_blocked_count, active_blocker_count
+FROM tasks_full WHERE status = ? ORDER BY created_at DESC;
+"""
+
+# tasks_full only contains open tasks; ready tasks first, then by how many tasks they unblock
+SELECT_OPEN_TASKS_DEPENDENCY = """
+SELECT
+    task_id, title, description, status, created_at, updated_at, duration_min, llm_value, requirement,
+    tasks_blocked_count, active_blocker_count
+FROM tasks_full
+WHERE status IN ('pending', 'in_progress')
+ORDER BY active_blocker_count ASC, tasks_blocked_count DESC, created_at DESC;
 """
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from taskweaver.database.connection import init_database
+from taskweaver.database.connection import close_connections, init_database
 from taskweaver.database.dependency_repository import TaskDependencyRepository
 from taskweaver.database.repository import TaskRepository
 
@@ -26,6 +26,7 @@ def temp_db() -> Generator[Path]:
     yield db_path
 
     # Cleanup
+    close_connections(db_path)
     db_path.unlink(missing_ok=True)
 
 
@@ -4,7 +4,8 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from taskweaver.database.dependency_repository import TaskDependencyRepository
+from taskweaver.database.connection import _get_pool, get_read_connection
+from taskweaver.database.dependency_repository import TaskDependencyRepository, _creates_cycle
 from taskweaver.database.exceptions import DependencyError, TaskNotFoundError
 from taskweaver.database.models import TaskCreate
 from taskweaver.database.repository import TaskRepository
@@ -61,6 +62,52 @@ def test_add_dependency_nonexistent_task_fails(dep_repo: TaskDependencyRepositor
         dep_repo.add_dependency(task_id=uuid4(), blocker_id=tasks["B"])
 
 
+def test_add_dependency_reports_missing_blocker(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
+    """Test the missing task's own id is reported when only the blocker is missing."""
+    missing_id = uuid4()
+
+    with pytest.raises(TaskNotFoundError) as exc_info:
+        dep_repo.add_dependency(task_id=tasks["A"], blocker_id=missing_id)
+
+    assert exc_info.value.task_id == missing_id
+
+
+def test_add_dependencies_in_bulk(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
+    """Test several dependencies are created together."""
+    deps = dep_repo.add_dependencies([(tasks["A"], tasks["B"]), (tasks["B"], tasks["C"])])
+
+    assert [(dep.task_id, dep.blocker_id) for dep in deps] == [(tasks["A"], tasks["B"]), (tasks["B"], tasks["C"])]
+    assert [task.task_id for task in dep_repo.get_blockers(tasks["B"])] == [tasks["C"]]
+
+
+def test_add_dependencies_rejects_cycle_within_batch(
+    dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]
+) -> None:
+    """Test a cycle formed only by the new pairs rolls back the whole batch."""
+    with pytest.raises(DependencyError, match="cycle"):
+        dep_repo.add_dependencies([(tasks["A"], tasks["B"]), (tasks["B"], tasks["A"])])
+
+    assert dep_repo.get_blockers(tasks["A"]) == []
+
+
+def test_add_dependency_self_reference_fails(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
+    """Test a task blocking itself is reported as a cycle, not a constraint violation."""
+    with pytest.raises(DependencyError, match="cycle"):
+        dep_repo.add_dependency(tasks["A"], tasks["A"])
+
+
+def test_add_dependency_duplicate_fails(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
+    """Test re-adding an existing dependency, or repeating one in a batch, raises DependencyError."""
+    dep_repo.add_dependency(tasks["A"], tasks["B"])
+
+    with pytest.raises(DependencyError, match="already exists"):
+        dep_repo.add_dependency(tasks["A"], tasks["B"])
+    with pytest.raises(DependencyError, match="already exists"):
+        dep_repo.add_dependencies([(tasks["A"], tasks["C"]), (tasks["A"], tasks["C"])])
+
+    assert [task.task_id for task in dep_repo.get_blockers(tasks["A"])] == [tasks["B"]]
+
+
 # Remove Dependency Tests
 
 
@@ -113,6 +160,20 @@ def test_get_blockers_multiple(dep_repo: TaskDependencyRepository, tasks: dict[s
     assert blocker_ids == {tasks["B"], tasks["C"]}
 
 
+def test_iter_blocked_streams_tasks(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
+    """Test a partially consumed iterator holds no pooled connection and the lookup can be repeated."""
+    dep_repo.add_dependency(task_id=tasks["B"], blocker_id=tasks["A"])
+    dep_repo.add_dependency(task_id=tasks["C"], blocker_id=tasks["A"])
+
+    blocked = dep_repo.iter_blocked(tasks["A"])
+    first = next(blocked)
+    assert _get_pool(dep_repo.db_path, read_only=True)._idle.qsize() >= 1  # Connection already returned
+    blocked.close()
+
+    assert first.task_id in {tasks["B"], tasks["C"]}
+    assert {task.task_id for task in dep_repo.iter_blocked(tasks["A"])} == {tasks["B"], tasks["C"]}
+
+
 def test_get_blockers_only_active(
     dep_repo: TaskDependencyRepository, task_repo: TaskRepository, tasks: dict[str, UUID]
 ) -> None:
@@ -165,13 +226,19 @@ def test_get_blocked_multiple(dep_repo: TaskDependencyRepository, tasks: dict[st
 # Cycle Check Tests
 
 
+def _check_cycle(dep_repo: TaskDependencyRepository, task_id: UUID, blocker_id: UUID) -> bool:
+    """Would "task_id blocked by blocker_id" close a cycle in the repository's database?"""
+    with get_read_connection(dep_repo.db_path) as conn:
+        return _creates_cycle(conn, task_id, blocker_id)
+
+
 def test_cycle_check_no_cycle(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
     """Test cycle detection when no cycle exists."""
     dep_repo.add_dependency(task_id=tasks["A"], blocker_id=tasks["B"])
     dep_repo.add_dependency(task_id=tasks["B"], blocker_id=tasks["C"])
 
     # D -> A should not create a cycle
-    has_cycle = dep_repo._cycle_check(tasks["A"], tasks["D"])
+    has_cycle = _check_cycle(dep_repo, tasks["A"], tasks["D"])
     assert has_cycle is False
 
 
@@ -180,7 +247,7 @@ def test_cycle_check_direct_cycle(dep_repo: TaskDependencyRepository, tasks: dic
     dep_repo.add_dependency(task_id=tasks["A"], blocker_id=tasks["B"])
 
     # B -> A would create direct cycle
-    has_cycle = dep_repo._cycle_check(tasks["B"], tasks["A"])
+    has_cycle = _check_cycle(dep_repo, tasks["B"], tasks["A"])
     assert has_cycle is True
 
 
@@ -190,13 +257,13 @@ def test_cycle_check_transitive_cycle(dep_repo: TaskDependencyRepository, tasks:
     dep_repo.add_dependency(task_id=tasks["B"], blocker_id=tasks["C"])
 
     # C -> A would create transitive cycle
-    has_cycle = dep_repo._cycle_check(tasks["C"], tasks["A"])
+    has_cycle = _check_cycle(dep_repo, tasks["C"], tasks["A"])
     assert has_cycle is True
 
 
 def test_cycle_check_self_reference(dep_repo: TaskDependencyRepository, tasks: dict[str, UUID]) -> None:
     """Test detection of self-referencing cycle (A -> A)."""
-    has_cycle = dep_repo._cycle_check(tasks["A"], tasks["A"])
+    has_cycle = _check_cycle(dep_repo, tasks["A"], tasks["A"])
     assert has_cycle is True
 
 
@@ -209,12 +276,12 @@ def test_cycle_check_complex_graph(dep_repo: TaskDependencyRepository, tasks: di
     dep_repo.add_dependency(task_id=tasks["C"], blocker_id=tasks["D"])
 
     # D -> A would create cycle through multiple paths (D->B->A or D->C->A)
-    has_cycle = dep_repo._cycle_check(tasks["D"], tasks["A"])
+    has_cycle = _check_cycle(dep_repo, tasks["D"], tasks["A"])
     assert has_cycle is True
 
     # D -> B would also create cycle (D->B->D already exists)
-    has_cycle = dep_repo._cycle_check(tasks["D"], tasks["B"])
+    has_cycle = _check_cycle(dep_repo, tasks["D"], tasks["B"])
     assert has_cycle is True
 
-    has_cycle = dep_repo._cycle_check(tasks["A"], tasks["D"])
+    has_cycle = _check_cycle(dep_repo, tasks["A"], tasks["D"])
     assert has_cycle is False
@@ -0,0 +1,189 @@
+"""Tests for schema upgrades of existing databases."""
+
+import sqlite3
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from taskweaver.database.connection import close_connections
+from taskweaver.database.exceptions import SchemaVersionError
+from taskweaver.database.migrations import upgrade_schema
+from taskweaver.database.repository import TaskRepository
+from taskweaver.database.schema import SCHEMA_VERSION
+
+# Schema and data as written by schema version 3 (hyphenated UUID text, ISO timestamps)
+TASK_ID = UUID("0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b01")
+OPEN_BLOCKER_ID = UUID("0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b02")
+
+V3_SCHEMA = """
+CREATE TABLE tasks (
+    task_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL CHECK (length(title) <= 500),
+    description TEXT,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'in_progress', 'completed', 'cancelled')),
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    duration_min INTEGER NOT NULL,
+    llm_value REAL NOT NULL,
+    requirement TEXT NOT NULL
+);
+CREATE INDEX idx_tasks_task ON tasks(task_id);
+CREATE INDEX idx_tasks_status ON tasks(status);
+CREATE TABLE schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at TEXT NOT NULL
+);
+INSERT INTO schema_version VALUES (3, datetime('now'));
+CREATE TABLE task_dependencies(
+    dependency_id TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    blocker_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (task_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+    FOREIGN KEY (blocker_id) REFERENCES tasks(task_id) ON DELETE CASCADE,
+    UNIQUE(task_id, blocker_id),
+    CHECK(task_id != blocker_id)
+);
+CREATE INDEX idx_task_dependencies_task ON task_dependencies(task_id);
+CREATE INDEX idx_task_dependencies_blocker ON task_dependencies(blocker_id);
+CREATE VIEW tasks_full AS
+SELECT
+    t.*,
+    COALESCE(n_blocked.blocked_count, 0) as tasks_blocked_count,
+    COALESCE(n_blocker.blocker_count, 0) as active_blocker_count
+FROM tasks as t
+LEFT JOIN (
+    SELECT blocker_id, COUNT(*) as blocked_count
+    FROM task_dependencies
+    GROUP BY blocker_id
+) as n_blocked ON t.task_id = n_blocked.blocker_id
+LEFT JOIN (
+    SELECT td.task_id as blocked_id, COUNT(*) as blocker_count
+    FROM task_dependencies td
+    JOIN tasks blocker ON td.blocker_id = blocker.task_id
+    WHERE blocker.status IN ('pending', 'in_progress')
+    GROUP BY td.task_id
+) as n_blocker ON t.task_id = n_blocker.blocked_id
+WHERE t.status IN ('pending', 'in_progress');
+"""
+
+# Old task, blocked by an open and by a completed task
+V3_DATA = """
+INSERT INTO tasks VALUES (
+    '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b01', 'Old task', NULL, 'pending',
+    '2025-01-02T03:04:05.123456+00:00', '2025-01-02T03:04:05.123456+00:00', 30, 6.0, 'Old requirement'
+);
+INSERT INTO tasks VALUES (
+    '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b02', 'Open blocker', NULL, 'pending',
+    '2025-01-03T00:00:00+00:00', '2025-01-03T00:00:00+00:00', 10, 1.0, 'Requirement'
+);
+INSERT INTO tasks VALUES (
+    '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b03', 'Done blocker', NULL, 'completed',
+    '2025-01-04T00:00:00+00:00', '2025-01-05T00:00:00+00:00', 10, 1.0, 'Requirement'
+);
+INSERT INTO task_dependencies VALUES (
+    '5c0a7b1e-0000-4000-8000-000000000001', '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b01',
+    '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b02', '2025-01-06T00:00:00+00:00'
+);
+INSERT INTO task_dependencies VALUES (
+    '5c0a7b1e-0000-4000-8000-000000000002', '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b01',
+    '0b6f1e4c-9d1a-4c1e-8f3a-2a7c5d9e1b03', '2025-01-06T00:00:00+00:00'
+);
+"""
+
+
+@pytest.fixture
+def v3_db(tmp_path: Path) -> Generator[Path]:
+    """Create a database as written by schema version 3.
+
+    Yields:
+        Path to the database file.
+
+    """
+    db_path = tmp_path / "v3.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(V3_SCHEMA + V3_DATA)
+    conn.close()
+    yield db_path
+    close_connections(db_path)
+
+
+def _schema_version(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+    conn.close()
+    return version
+
+
+def test_newer_schema_fails_clearly(temp_db: Path) -> None:
+    """Test that a database from a newer release is rejected, not silently misread."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("INSERT INTO schema_version VALUES (?, datetime('now'))", (SCHEMA_VERSION + 1,))
+    conn.close()
+    close_connections(temp_db)
+
+    with pytest.raises(SchemaVersionError, match="newer than supported"):
+        TaskRepository(temp_db).list_tasks()
+
+
+def test_unsupported_old_schema_fails_clearly(v3_db: Path) -> None:
+    """Test that an old database without an upgrade path fails instead of misreading rows."""
+    with sqlite3.connect(v3_db) as conn:
+        conn.execute("UPDATE schema_version SET version = 2")
+    conn.close()
+
+    with pytest.raises(SchemaVersionError, match="restartDB --delete"):
+        TaskRepository(v3_db).list_tasks()
+
+    # The failed upgrade is rolled back
+    assert _schema_version(v3_db) == 2  # noqa: PLR2004
+
+
+def test_old_database_is_upgraded_on_open(v3_db: Path) -> None:
+    """Test that a schema version 3 database is readable and writable after opening it."""
+    task_repo = TaskRepository(v3_db)
+
+    task = task_repo.get_task(TASK_ID)
+    assert task is not None
+    assert task.created_at == datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)
+    assert _schema_version(v3_db) == SCHEMA_VERSION
+
+    expected_count = 3
+    assert len(task_repo.list_tasks()) == expected_count
+
+    counts = {t.task_id: (t.tasks_blocked_count, t.active_blocker_count) for t in task_repo.list_tasks_with_deps()}
+    assert counts == {TASK_ID: (0, 1), OPEN_BLOCKER_ID: (1, 0)}
+
+    # Triggers installed by the upgrade keep the backfilled counts current
+    task_repo.mark_completed(OPEN_BLOCKER_ID)
+    assert [(t.task_id, t.active_blocker_count) for t in task_repo.list_open_tasks_with_deps()] == [(TASK_ID, 0)]
+
+
+def test_upgrade_converts_text_ids_to_bytes(v3_db: Path) -> None:
+    """Test that hyphenated text ids become the 16 raw UUID bytes."""
+    with sqlite3.connect(v3_db) as conn:
+        upgrade_schema(conn, 3, target=4)
+        task_ids = dict(conn.execute("SELECT task_id, typeof(task_id) FROM tasks"))
+        blocked_ids = {row[0] for row in conn.execute("SELECT task_id FROM task_dependencies")}
+    conn.close()
+
+    assert set(task_ids.values()) == {"blob"}
+    assert TASK_ID.bytes in task_ids
+    assert blocked_ids == {TASK_ID.bytes}
+
+
+def test_upgrade_converts_iso_timestamps_to_micros(v3_db: Path) -> None:
+    """Test that ISO text timestamps become exact integer microseconds."""
+    with sqlite3.connect(v3_db) as conn:
+        upgrade_schema(conn, 3, target=5)
+        created_at, kind = conn.execute("SELECT created_at, typeof(created_at) FROM tasks").fetchone()
+    conn.close()
+
+    assert kind == "integer"
+    assert datetime(1970, 1, 1, tzinfo=UTC) + timedelta(microseconds=created_at) == datetime(
+        2025, 1, 2, 3, 4, 5, 123456, tzinfo=UTC
+    )
@@ -1,14 +1,18 @@
 """Tests for task repository."""
 
+import sqlite3
+from itertools import pairwise
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+from taskweaver.database.connection import close_connections, get_connection, get_read_connection, write_tx
 from taskweaver.database.dependency_repository import TaskDependencyRepository
 from taskweaver.database.exceptions import TaskNotFoundError
-from taskweaver.database.models import TaskCreate, TaskStatus, TaskUpdate, TaskWithDependencies, TaskWithPriority
-from taskweaver.database.repository import TaskRepository
+from taskweaver.database.models import Task, TaskCreate, TaskStatus, TaskUpdate, TaskWithDependencies, TaskWithPriority
+from taskweaver.database.repository import TaskRepository, _trusted_constructor
 
 
 def test_create_task(task_repo: TaskRepository) -> None:
@@ -157,6 +161,32 @@ def test_delete_task(task_repo: TaskRepository) -> None:
     assert task is None
 
 
+def test_create_and_delete_tasks_in_bulk(task_repo: TaskRepository) -> None:
+    """Test bulk creation keeps input order and bulk deletion removes every task."""
+    tasks = task_repo.create_tasks(
+        TaskCreate(title=f"Bulk {i}", duration_min=30, llm_value=50.0, requirement="Test requirement") for i in range(3)
+    )
+
+    assert [task.title for task in tasks] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert {task.task_id for task in task_repo.list_tasks()} == {task.task_id for task in tasks}
+
+    task_repo.delete_tasks(task.task_id for task in tasks)
+
+    assert task_repo.list_tasks() == []
+
+
+def test_delete_tasks_is_all_or_nothing(task_repo: TaskRepository) -> None:
+    """Test bulk deletion with a missing task raises and deletes nothing."""
+    task = task_repo.create_task(TaskCreate(title="Keep me", duration_min=30, llm_value=50.0, requirement="Done"))
+    missing_id = uuid4()
+
+    with pytest.raises(TaskNotFoundError) as exc_info:
+        task_repo.delete_tasks([task.task_id, missing_id])
+
+    assert exc_info.value.task_id == missing_id
+    assert task_repo.get_task(task.task_id) is not None
+
+
 def test_mark_completed_nonexistent_task(task_repo: TaskRepository) -> None:
     """Test marking non-existent task as completed raises TaskNotFoundError."""
     with pytest.raises(TaskNotFoundError) as exc_info:
@@ -213,6 +243,102 @@ def test_auto_initialize_database(tmp_path: Path) -> None:
     assert retrieved.task_id == task.task_id
 
 
+def test_task_ids_stored_as_16_byte_blobs(task_repo: TaskRepository, temp_db: Path) -> None:
+    """Test UUIDs are stored as raw bytes and read back as UUID objects."""
+    task = task_repo.create_task(TaskCreate(title="Blob id", duration_min=30, llm_value=50.0, requirement="Done"))
+
+    with get_read_connection(temp_db) as conn:
+        row = conn.execute("SELECT task_id, typeof(task_id), length(task_id) FROM tasks").fetchone()
+
+    uuid_bytes = 16
+    assert tuple(row) == (task.task_id, "blob", uuid_bytes)
+
+
+def test_no_global_uuid_adapter(task_repo: TaskRepository) -> None:  # noqa: ARG001
+    """Test the repository leaves sqlite3's process-wide adapters alone."""
+    assert (UUID, sqlite3.PrepareProtocol) not in sqlite3.adapters
+
+
+def test_timestamps_stored_as_integer_micros(task_repo: TaskRepository, temp_db: Path) -> None:
+    """Test timestamps are stored as integers and read back unchanged."""
+    task = task_repo.create_task(TaskCreate(title="Int time", duration_min=30, llm_value=50.0, requirement="Done"))
+
+    with get_read_connection(temp_db) as conn:
+        row = conn.execute("SELECT typeof(created_at), typeof(updated_at) FROM tasks").fetchone()
+
+    assert tuple(row) == ("integer", "integer")
+    assert task_repo.get_task(task.task_id).created_at == task.created_at
+
+
+def test_read_tasks_match_created_tasks(task_repo: TaskRepository) -> None:
+    """Test trusted row hydration yields models equal to the validated originals."""
+    task = task_repo.create_task(TaskCreate(title="Round trip", duration_min=30, llm_value=50.0, requirement="Done"))
+
+    read = task_repo.get_task(task.task_id)
+    (listed,) = task_repo.list_tasks_with_deps()
+
+    assert read == task
+    assert read.model_dump() == task.model_dump()
+    assert read.model_fields_set == set(Task.model_fields)
+    assert listed.priority == task.priority
+    # Reads return the same status type as create_task
+    assert type(read.status) is type(listed.status) is type(task.status) is TaskStatus
+
+
+def test_connection_uses_wal(temp_db: Path) -> None:
+    """Test connections run in WAL mode with relaxed synchronous commits."""
+    with get_connection(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_connections_are_pooled(temp_db: Path) -> None:
+    """Test a connection is reused after a clean exit and dropped after an error."""
+    with get_connection(temp_db) as conn:
+        first = conn
+    with get_connection(temp_db) as conn:
+        assert conn is first
+
+    with pytest.raises(ValueError, match="boom"), get_connection(temp_db) as conn:
+        raise ValueError("boom")
+    with get_connection(temp_db) as conn:
+        assert conn is not first
+
+
+def test_read_connection_rejects_writes(temp_db: Path) -> None:
+    """Test connections from the read pool are query-only."""
+    with get_read_connection(temp_db) as conn:
+        assert conn.execute("SELECT count(*) FROM tasks").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("DELETE FROM tasks")
+
+
+def test_write_tx_rolls_back_on_error(task_repo: TaskRepository, temp_db: Path) -> None:
+    """Test a failed write transaction leaves no partial changes."""
+    task = task_repo.create_task(TaskCreate(title="Keep me", duration_min=30, llm_value=50.0, requirement="Done"))
+
+    def delete_all_then_fail() -> None:
+        with get_connection(temp_db) as conn, write_tx(conn):
+            conn.execute("DELETE FROM tasks")
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        delete_all_then_fail()
+
+    assert task_repo.get_task(task.task_id) is not None
+
+
+def test_deleted_database_is_reinitialized(temp_db: Path) -> None:
+    """Test a database removed after close_connections is recreated on next use."""
+    with get_connection(temp_db):
+        pass
+    close_connections(temp_db)
+    temp_db.unlink()
+
+    with get_connection(temp_db) as conn:
+        assert conn.execute("SELECT count(*) FROM tasks").fetchone()[0] == 0
+
+
 def test_task_priority_calculation(task_repo: TaskRepository) -> None:
     """Test that priority is correctly calculated as llm_value / duration_min."""
     # High value, short duration = high priority
@@ -429,6 +555,95 @@ def test_effective_priority_multiple_blocked_tasks(task_repo: TaskRepository) ->
     assert effective == 2.0  # noqa: PLR2004
 
 
+def test_effective_priority_long_chain(task_repo: TaskRepository) -> None:
+    """Test priority propagates from the end of a long chain to its first blocker."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    chain_length = 200
+    tasks = task_repo.create_tasks(
+        TaskCreate(title=f"Step {i}", duration_min=100, llm_value=10.0, requirement="Test requirement")
+        for i in range(chain_length)
+    )
+    urgent = task_repo.create_task(
+        TaskCreate(title="Urgent", duration_min=10, llm_value=100.0, requirement="Test requirement")
+    )
+    chain = [*tasks, urgent]
+    # Each step is blocked by the one before it; the urgent task sits at the end
+    dep_repo.add_dependencies((blocked.task_id, blocker.task_id) for blocker, blocked in pairwise(chain))
+
+    priorities = dep_repo.calculate_effective_priorities()
+
+    assert priorities[tasks[0].task_id] == urgent.priority
+
+
+def test_list_open_tasks_with_deps(task_repo: TaskRepository) -> None:
+    """Test open tasks are listed ready-first and closed tasks are excluded."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    blocker = task_repo.create_task(TaskCreate(title="Blocker", duration_min=10, llm_value=5.0, requirement="R"))
+    blocked = task_repo.create_task(TaskCreate(title="Blocked", duration_min=10, llm_value=5.0, requirement="R"))
+    done = task_repo.create_task(TaskCreate(title="Done", duration_min=10, llm_value=5.0, requirement="R"))
+    dep_repo.add_dependency(blocked.task_id, blocker.task_id)
+    task_repo.mark_completed(done.task_id)
+
+    tasks = task_repo.list_open_tasks_with_deps()
+
+    assert [task.task_id for task in tasks] == [blocker.task_id, blocked.task_id]
+    assert tasks[0].tasks_blocked_count == 1
+    assert tasks[1].active_blocker_count == 1
+
+
+def test_dependency_counts_follow_changes(task_repo: TaskRepository) -> None:
+    """Test materialized counts track dependency, status and deletion changes."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    first, second, blocked = (
+        task_repo.create_task(TaskCreate(title=title, duration_min=10, llm_value=5.0, requirement="R")).task_id
+        for title in ("First", "Second", "Blocked")
+    )
+    dep_repo.add_dependencies([(blocked, first), (blocked, second)])
+
+    def counts(task_id: UUID) -> tuple[int, int]:
+        task = next(task for task in task_repo.list_tasks_with_deps() if task.task_id == task_id)
+        return task.tasks_blocked_count, task.active_blocker_count
+
+    both_active = 2
+    assert counts(blocked) == (0, both_active)
+    task_repo.mark_completed(first)
+    assert counts(blocked) == (0, 1)
+    task_repo.mark_in_progress(first)
+    assert counts(blocked) == (0, both_active)
+    dep_repo.remove_dependency(blocked, first)
+    assert counts(first) == (0, 0)
+    assert counts(blocked) == (0, 1)
+    task_repo.delete_task(second)
+    assert counts(blocked) == (0, 0)
+
+
+def test_effective_priority_ignores_edge_to_deleted_blocker(task_repo: TaskRepository) -> None:
+    """Test that a dependency row left behind by a deleted blocker is skipped."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    blocked = task_repo.create_task(TaskCreate(title="Blocked", duration_min=60, llm_value=60.0, requirement="R"))
+    blocker = task_repo.create_task(TaskCreate(title="Gone", duration_min=60, llm_value=6.0, requirement="R"))
+    dep_repo.add_dependency(blocked.task_id, blocker.task_id)
+
+    task_repo.delete_task(blocker.task_id)  # Foreign keys are off: the dependency row stays
+
+    assert dep_repo.calculate_effective_priorities() == {blocked.task_id: 1.0}
+    assert [task.effective_priority for task in dep_repo.list_tasks_with_priority()] == [1.0]
+
+
+def test_effective_priority_ignores_edge_from_deleted_task(task_repo: TaskRepository) -> None:
+    """Test that a blocker whose blocked task was deleted still passes its priority upstream."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    upstream = task_repo.create_task(TaskCreate(title="Upstream", duration_min=60, llm_value=30.0, requirement="R"))
+    blocker = task_repo.create_task(TaskCreate(title="Blocker", duration_min=60, llm_value=60.0, requirement="R"))
+    blocked = task_repo.create_task(TaskCreate(title="Gone", duration_min=60, llm_value=6.0, requirement="R"))
+    dep_repo.add_dependency(blocker.task_id, upstream.task_id)
+    dep_repo.add_dependency(blocked.task_id, blocker.task_id)
+
+    task_repo.delete_task(blocked.task_id)
+
+    assert dep_repo.calculate_effective_priorities() == {upstream.task_id: 1.0, blocker.task_id: 1.0}
+
+
 def test_list_tasks_with_priority(task_repo: TaskRepository) -> None:
     """Test listing tasks with TaskWithPriority model."""
     dep_repo = TaskDependencyRepository(task_repo.db_path)
@@ -462,3 +677,51 @@ def test_list_tasks_with_priority(task_repo: TaskRepository) -> None:
 
     # Can easily compare intrinsic vs effective
     assert blocker_enriched.effective_priority > blocker_enriched.priority
+
+
+def test_list_tasks_with_priority_filters_by_status(task_repo: TaskRepository) -> None:
+    """Test the status filter keeps priorities inherited from tasks outside it."""
+    dep_repo = TaskDependencyRepository(task_repo.db_path)
+    blocker = task_repo.create_task(
+        TaskCreate(title="Blocker", duration_min=100, llm_value=50.0, requirement="Test requirement")
+    )
+    blocked = task_repo.create_task(
+        TaskCreate(title="Blocked", duration_min=50, llm_value=100.0, requirement="Test requirement")
+    )
+    dep_repo.add_dependency(blocked.task_id, blocker.task_id)
+    task_repo.mark_in_progress(blocked.task_id)
+
+    pending = dep_repo.list_tasks_with_priority(TaskStatus.PENDING)
+
+    assert [task.task_id for task in pending] == [blocker.task_id]
+    assert pending[0].effective_priority == blocked.priority
+
+
+def test_hydrated_rows_match_validated_models(task_repo: TaskRepository, sample_task_data: dict) -> None:
+    """Test that models built from rows without validation equal their model_validate counterparts."""
+    task = task_repo.create_task(TaskCreate(**sample_task_data))
+
+    fetched = task_repo.get_task(task.task_id)
+    assert fetched is not None
+    listed = task_repo.list_tasks_with_deps()[0]
+    for hydrated in (fetched, listed):
+        validated = type(hydrated).model_validate(hydrated.model_dump())
+        assert hydrated == validated
+        assert hydrated.__dict__ == validated.__dict__
+        assert hydrated.model_fields_set == validated.model_fields_set
+
+
+def test_trusted_constructor_rejects_unsupported_models() -> None:
+    """Test that models whose extra or private state the shortcut can't set are refused."""
+
+    class WithPrivate(BaseModel):
+        value: int
+        _cache: int = PrivateAttr(default=0)
+
+    class WithExtra(BaseModel):
+        model_config = ConfigDict(extra="allow")
+        value: int
+
+    for model in (WithPrivate, WithExtra):
+        with pytest.raises(TypeError, match="model_construct"):
+            _trusted_constructor(model)
@@ -45,6 +45,14 @@ def sample_task(test_db: Path) -> str:
     return str(task.task_id)
 
 
+def test_no_args_shows_help() -> None:
+    """Test running without a command prints the usage and command list."""
+    result = runner.invoke(app, [])
+
+    assert "Usage:" in result.output
+    assert "create" in result.output
+
+
 def test_create_command_with_title_only(test_db: Path) -> None:
     """Test create command with title only."""
     result = runner.invoke(
@@ -120,6 +128,43 @@ def test_list_command_with_tasks(test_db: Path, sample_task: str) -> None:  # no
     assert "+00:00" not in output  # No timezone in list view
 
 
+def test_list_command_large_list_prints_tsv(
+    test_db: Path,
+    sample_task: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test listings above the threshold are printed as plain TSV rows."""
+    monkeypatch.setattr("taskweaver.cli.PLAIN_LIST_THRESHOLD", 0)
+    result = runner.invoke(app, ["ls", "--db", str(test_db)])
+    lines = strip_ansi(result.stdout).splitlines()
+
+    assert result.exit_code == 0
+    assert lines[0].startswith("task_id\ttitle\t")
+    assert lines[1].startswith(f"{sample_task}\tSample")
+    assert "Total: 1 task(s)" in lines[-1]
+
+
+def test_list_command_tsv_escapes_cells(test_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test tabs, newlines and backslashes inside cells can't break the TSV layout."""
+    TaskRepository(test_db).create_task(
+        TaskCreate(
+            title="a\tb",
+            description="line 1\nline 2 C:\\tmp",
+            duration_min=30,
+            llm_value=50.0,
+            requirement="Done",
+        )
+    )
+    monkeypatch.setattr("taskweaver.cli.PLAIN_LIST_THRESHOLD", 0)
+    result = runner.invoke(app, ["ls", "--db", str(test_db)])
+    lines = strip_ansi(result.stdout).splitlines()
+
+    header, row = lines[0].split("\t"), lines[1].split("\t")
+    assert len(row) == len(header)
+    assert row[header.index("title")] == "a\\tb"
+    assert row[header.index("description")] == "line 1\\nline 2 C:\\\\tmp"
+
+
 def test_list_command_filter_by_status(test_db: Path) -> None:
     """Test list command with status filter."""
     repo = TaskRepository(test_db)
@@ -200,6 +245,36 @@ def test_delete_command_with_confirmation_no(test_db: Path, sample_task: str) ->
     assert len(tasks) == 1
 
 
+def test_delete_command_multiple_tasks(test_db: Path) -> None:
+    """Test delete command removes several tasks at once."""
+    repo = TaskRepository(test_db)
+    task_ids = [
+        str(repo.create_task(TaskCreate(title=title, duration_min=30, llm_value=50.0, requirement="Done")).task_id)
+        for title in ("First", "Second")
+    ]
+
+    result = runner.invoke(app, ["rm", *task_ids, "-f", "--db", str(test_db)])
+
+    assert result.exit_code == 0
+    assert repo.list_tasks() == []
+
+
+def test_bulk_create_command(test_db: Path, tmp_path: Path) -> None:
+    """Test bulk-create creates every task in a JSONL file."""
+    source = tmp_path / "tasks.jsonl"
+    source.write_text(
+        '{"title": "First", "duration_min": 30, "llm_value": 50.0, "requirement": "Done"}\n'
+        "\n"
+        '{"title": "Second", "duration_min": 60, "llm_value": 80.0, "requirement": "Done", "description": "x"}\n'
+    )
+
+    result = runner.invoke(app, ["bulk-create", "--from", str(source), "--db", str(test_db)])
+
+    assert result.exit_code == 0
+    assert "Created 2 task(s)" in result.stdout
+    assert {task.title for task in TaskRepository(test_db).list_tasks()} == {"First", "Second"}
+
+
 def test_show_command_existing_task(test_db: Path, sample_task: str) -> None:
     """Test show command with existing task."""
     result = runner.invoke(app, ["show", sample_task, "--db", str(test_db)])
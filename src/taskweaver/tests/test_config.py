@@ -1,6 +1,10 @@
 """Tests for XDG-compliant configuration system."""
 
+import os
 from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
 
 from taskweaver import config as config_module
 from taskweaver.config import (
@@ -131,7 +135,7 @@ def test_get_config_returns_defaults_when_no_file(monkeypatch, tmp_path):
     monkeypatch.setattr(config_module, "get_project_root", lambda: None)
 
     # Clear cache to force reload
-    get_config.cache_clear()
+    config_module._config_cache.clear()
     get_paths.cache_clear()
 
     config = get_config()
@@ -160,7 +164,7 @@ auto_decompose = false
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
 
     # Clear cache to force reload
-    get_config.cache_clear()
+    config_module._config_cache.clear()
     get_paths.cache_clear()
 
     config = get_config()
@@ -179,12 +183,136 @@ def test_get_paths_is_cached():
 
 def test_get_config_is_cached():
     """Test get_config returns same instance (cached)."""
-    get_config.cache_clear()
+    config_module._config_cache.clear()
     config1 = get_config()
     config2 = get_config()
     assert config1 is config2
 
 
+def test_get_config_ignores_unknown_keys(monkeypatch, tmp_path):
+    """Test unknown keys in config.toml are ignored rather than rejected."""
+    config_file = tmp_path / "taskweaver" / "config.toml"
+    config_file.parent.mkdir()
+    config_file.write_text('model = "gpt-4"\ntheme = "dark"\n')
+
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+
+    assert get_config().model == "gpt-4"
+
+
+def test_get_config_stores_github_repos_as_tuple(monkeypatch, tmp_path):
+    """Test a TOML array of repos becomes an immutable tuple."""
+    config_file = tmp_path / "taskweaver" / "config.toml"
+    config_file.parent.mkdir()
+    config_file.write_text('github_repos = ["owner/one", "owner/two"]\n')
+
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+
+    assert get_config().github_repos == ("owner/one", "owner/two")
+
+
+@pytest.mark.parametrize(
+    "line",
+    ['github_repos = "owner/repo"', 'auto_decompose = "yes"', "model = 4", "github_repos = [1, 2]"],
+)
+def test_get_config_rejects_wrong_types(monkeypatch, tmp_path, line):
+    """Test config values of the wrong type are rejected instead of silently misused."""
+    config_file = tmp_path / "taskweaver" / "config.toml"
+    config_file.parent.mkdir()
+    config_file.write_text(f"{line}\n")
+
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+
+    with pytest.raises(TypeError, match=line.split(" ", 1)[0]):
+        get_config()
+
+
+def test_get_config_reloads_changed_file(monkeypatch, tmp_path):
+    """Test get_config re-parses a config file after it is modified."""
+    config_file = tmp_path / "taskweaver" / "config.toml"
+    config_file.parent.mkdir()
+    config_file.write_text('model = "gpt-4"\n')
+
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+
+    assert get_config().model == "gpt-4"
+
+    config_file.write_text('model = "gpt-4o"\n')
+    mtime_ns = config_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+    assert get_config(reload=True).model == "gpt-4o"
+
+
+def test_get_config_rechecks_files_after_interval(monkeypatch, tmp_path):
+    """Test config files are not stat'ed again until the recheck interval has passed."""
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+    clock = iter([0.0, 1.0, config_module.CONFIG_RECHECK_INTERVAL_S + 1])
+    monkeypatch.setattr(config_module, "monotonic", lambda: next(clock))
+    files_key = Mock(wraps=config_module._config_files_key)
+    monkeypatch.setattr(config_module, "_config_files_key", files_key)
+
+    get_config()
+    get_config()
+    assert files_key.call_count == 1
+
+    get_config()
+    expected_checks = 2
+    assert files_key.call_count == expected_checks
+
+
+def test_get_config_skips_parsing_unchanged_content(monkeypatch, tmp_path):
+    """Test a touched config file with identical content is not parsed again."""
+    config_file = tmp_path / "taskweaver" / "config.toml"
+    config_file.parent.mkdir()
+    config_file.write_text('model = "gpt-4"\n')
+
+    monkeypatch.setattr(config_module, "get_project_root", lambda: None)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    get_paths.cache_clear()
+    assert get_config().model == "gpt-4"
+
+    mtime_ns = config_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+    monkeypatch.setattr(config_module.tomllib, "loads", Mock(side_effect=AssertionError("re-parsed")))
+
+    assert get_config(reload=True).model == "gpt-4"
+
+
+def test_load_env_file_prefers_project_env(monkeypatch, tmp_path):
+    """Test the project-local .env is loaded and overrides existing variables."""
+    (tmp_path / ".env").write_text("TASKWEAVER_TEST_VAR=local\n")
+    monkeypatch.setattr(config_module, "get_project_root", lambda: tmp_path)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("TASKWEAVER_TEST_VAR", "old")  # Restored by monkeypatch afterwards
+
+    config_module._load_env_file()
+
+    assert os.environ["TASKWEAVER_TEST_VAR"] == "local"
+
+
+def test_load_env_file_can_be_skipped(monkeypatch, tmp_path):
+    """Test TASKWEAVER_SKIP_DOTENV=1 leaves the environment untouched."""
+    (tmp_path / ".env").write_text("TASKWEAVER_TEST_VAR=local\n")
+    monkeypatch.setattr(config_module, "get_project_root", lambda: tmp_path)
+    monkeypatch.setenv("TASKWEAVER_SKIP_DOTENV", "1")
+    monkeypatch.setenv("TASKWEAVER_TEST_VAR", "old")
+
+    config_module._load_env_file()
+
+    assert os.environ["TASKWEAVER_TEST_VAR"] == "old"
+
+
 def test_get_project_root_finds_pyproject(tmp_path, monkeypatch):
     """Test get_project_root finds project with pyproject.toml."""
     project_dir = tmp_path / "myproject"
@@ -226,6 +354,25 @@ def test_get_project_root_searches_parents(tmp_path, monkeypatch):
     assert root == project_dir
 
 
+def test_get_project_root_skips_unreadable_directory(tmp_path, monkeypatch):
+    """Test an unreadable directory doesn't stop the search in its parents."""
+    project_dir = tmp_path / "myproject"
+    (project_dir / "locked").mkdir(parents=True)
+    (project_dir / "pyproject.toml").touch()
+    monkeypatch.chdir(project_dir / "locked")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if Path(path).name == "locked":
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(config_module.os, "scandir", scandir)
+
+    assert get_project_root() == project_dir
+
+
 def test_get_project_root_returns_none_if_not_found(tmp_path, monkeypatch):
     """Test get_project_root returns None when no project found."""
     no_project_dir = tmp_path / "random"
@@ -323,7 +470,7 @@ api_endpoint = "https://api.anthropic.com/v1"
     monkeypatch.chdir(project_dir)
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
 
-    get_config.cache_clear()
+    config_module._config_cache.clear()
     get_paths.cache_clear()
 
     config = get_config()